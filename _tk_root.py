@@ -0,0 +1,33 @@
+"""
+Shared hidden Tk root for the test suites.
+Building a ttkbootstrap Window sets up its theme engine, so test entry points
+running in the same process reuse one instead of each creating their own.
+"""
+import tkinter as tk
+import ttkbootstrap as tb
+from config import THEMES
+
+_root = None
+
+def get_root() -> tb.Window:
+    """Return the shared, withdrawn test root, creating it on first use."""
+    global _root
+    try:
+        alive = _root is not None and _root.winfo_exists()
+    except tk.TclError:
+        # The root was destroyed behind our back; build a new one
+        alive = False
+    if not alive:
+        _root = tb.Window(themename=THEMES["light"]["name"])
+        _root.withdraw()
+    return _root
+
+def destroy_root():
+    """Destroy the shared root, if any, so the next get_root() builds a fresh one."""
+    global _root
+    if _root is not None:
+        try:
+            _root.destroy()
+        except tk.TclError:
+            pass
+        _root = None
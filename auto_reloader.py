@@ -7,8 +7,171 @@ import sys
 import time
 import subprocess
 import signal
+import select
+import runpy
+import traceback
+import importlib
+import asyncio
 from pathlib import Path
 
+try:
+    from watchfiles import awatch
+except ImportError:
+    # watchfiles is optional; watchdog or polling are used without it
+    awatch = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    # watchdog is optional; fall back to polling when it is not installed
+    Observer = None
+    FileSystemEventHandler = object
+
+# Third-party packages imported once in the reloader so forked children skip
+# their import cost. Project modules are left out so each restart sees edits.
+PRELOAD_MODULES = ('tkinter', 'ttkbootstrap', 'sqlalchemy', 'sqlmodel')
+
+def _run_app():
+    """Run main.py in the current, already-warm interpreter and never return."""
+    exit_code = 0
+    try:
+        sys.argv = ['main.py']
+        runpy.run_path('main.py', run_name='__main__')
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+class _Zygote:
+    """Preloaded child process that forks application processes on request.
+    
+    It is forked before any watcher thread or event loop exists and stays
+    single-threaded, so its forks cannot inherit locks held by other threads.
+    Replies are lines on a pipe: ``P<pid>`` after a spawn and ``X<code>``
+    once that app has exited and been reaped.
+    """
+    
+    def __init__(self):
+        # Flush first, or every forked app inherits the buffered banner and
+        # writes it out again when it flushes on exit
+        sys.stdout.flush()
+        sys.stderr.flush()
+        cmd_r, self._cmd_w = os.pipe()
+        self._reply_r, reply_w = os.pipe()
+        self._buffer = b''
+        self.pid = os.fork()
+        if self.pid == 0:
+            os.close(self._cmd_w)
+            os.close(self._reply_r)
+            self._serve(cmd_r, reply_w)
+        os.close(cmd_r)
+        os.close(reply_w)
+    
+    @staticmethod
+    def _serve(cmd_r, reply_w):
+        # Ctrl+C reaches the whole process group; the reloader shuts us down
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            # Each command byte is a spawn request; EOF means the reloader is gone
+            while os.read(cmd_r, 1):
+                pid = os.fork()
+                if pid == 0:
+                    os.close(cmd_r)
+                    os.close(reply_w)
+                    signal.signal(signal.SIGINT, signal.default_int_handler)
+                    _run_app()
+                os.write(reply_w, b'P%d\n' % pid)
+                _, status = os.waitpid(pid, 0)
+                os.write(reply_w, b'X%d\n' % os.waitstatus_to_exitcode(status))
+        finally:
+            os._exit(0)
+    
+    def spawn(self):
+        """Fork a new application process and return a Popen-like handle."""
+        os.write(self._cmd_w, b'S')
+        return _ForkedApp(self, self.read_reply(b'P'))
+    
+    def read_reply(self, kind, timeout=None):
+        """Return the value of the next reply of the given kind, or None on timeout.
+        
+        Replies of other kinds (exit codes nobody waited for) are discarded.
+        """
+        while True:
+            while b'\n' not in self._buffer:
+                if not select.select([self._reply_r], [], [], timeout)[0]:
+                    return None
+                chunk = os.read(self._reply_r, 64)
+                if not chunk:
+                    raise ChildProcessError("reloader zygote exited")
+                self._buffer += chunk
+            line, self._buffer = self._buffer.split(b'\n', 1)
+            if line[:1] == kind:
+                return int(line[1:])
+    
+    def close(self):
+        """Tell the zygote to exit and reap it."""
+        os.close(self._cmd_w)
+        os.waitpid(self.pid, 0)
+        os.close(self._reply_r)
+
+class _ForkedApp:
+    """Popen-like handle for an application forked by the zygote."""
+    
+    def __init__(self, zygote, pid):
+        self._zygote = zygote
+        self.pid = pid
+        self.returncode = None
+    
+    def poll(self):
+        return self._collect(0)
+    
+    def wait(self, timeout=None):
+        if self._collect(timeout) is None:
+            raise subprocess.TimeoutExpired('main.py', timeout)
+        return self.returncode
+    
+    def _collect(self, timeout):
+        # The zygote reaps the app and reports its exit code
+        if self.returncode is None:
+            self.returncode = self._zygote.read_reply(b'X', timeout)
+        return self.returncode
+    
+    def terminate(self):
+        self._signal(signal.SIGTERM)
+    
+    def kill(self):
+        self._signal(signal.SIGKILL)
+        self.wait()
+    
+    def _signal(self, sig):
+        if self.poll() is None:
+            os.kill(self.pid, sig)
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Filesystem event handler that forwards relevant changes to the reloader."""
+    
+    def __init__(self, reloader):
+        super().__init__()
+        self.reloader = reloader
+    
+    def on_modified(self, event):
+        self._handle(event)
+    
+    def on_created(self, event):
+        self._handle(event)
+    
+    def _handle(self, event):
+        if event.is_directory:
+            return
+        if self.reloader.is_watched_path(event.src_path):
+            self.reloader.on_file_event()
+
 class AutoReloader:
     """Auto-reloader for development."""
     
@@ -18,6 +181,11 @@ class AutoReloader:
         self.ignored_dirs = {'.git', '__pycache__', '.pytest_cache', 'venv', 'env'}
         self.last_restart = 0
         self.restart_cooldown = 2  # seconds
+        self._last_mtime = time.time()
+        self._min_sleep = 0.1  # seconds, poll interval right after a change
+        self._max_sleep = 2.0  # seconds, poll interval ceiling when idle
+        self._idle_sleep = self._min_sleep
+        self._zygote = None
         
     def start(self):
         """Start the auto-reloader."""
@@ -26,14 +194,91 @@ class AutoReloader:
         print("⏹️  Press Ctrl+C to stop")
         print("-" * 50)
         
+        if hasattr(os, 'fork'):
+            self._preload()
+            # Fork the zygote now, while this process is still single-threaded
+            self._zygote = _Zygote()
+        
+        if awatch is not None:
+            try:
+                asyncio.run(self._awatch())
+            except KeyboardInterrupt:
+                pass
+            finally:
+                self.stop()
+        elif Observer is None:
+            print("ℹ️  watchfiles/watchdog not installed, falling back to polling")
+            self._poll()
+        else:
+            self._watch()
+    
+    async def _awatch(self):
+        """Await kernel change notifications and restart on relevant changes."""
+        root = Path(__file__).parent
+        async for _changes in awatch(root, watch_filter=lambda _change, path: self.is_watched_path(path)):
+            self.on_file_event()
+    
+    def _watch(self):
+        """Wait for filesystem events and restart on relevant changes."""
+        observer = Observer()
+        observer.schedule(_ChangeHandler(self), str(Path(__file__).parent), recursive=True)
+        observer.start()
+        
+        try:
+            while observer.is_alive():
+                observer.join(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            observer.stop()
+            observer.join()
+            self.stop()
+    
+    def _poll(self):
+        """Poll the project tree for changes (used when watchdog is missing)."""
         try:
             while True:
                 if self.should_restart():
                     self.restart_app()
-                time.sleep(1)
+                    # Poll quickly again in case more saves follow
+                    self._idle_sleep = self._min_sleep
+                else:
+                    # Back off while nothing is changing
+                    self._idle_sleep = min(self._max_sleep, self._idle_sleep * 1.5)
+                time.sleep(self._idle_sleep)
         except KeyboardInterrupt:
             self.stop()
     
+    def _preload(self):
+        """Import heavy third-party packages once so restarts inherit them."""
+        for name in PRELOAD_MODULES:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+    
+    def _spawn(self):
+        """Start main.py, forked from the preloaded zygote when possible."""
+        if self._zygote is None:
+            return subprocess.Popen([sys.executable, 'main.py'])
+        return self._zygote.spawn()
+    
+    def is_watched_path(self, path):
+        """Check if a changed path should trigger a restart."""
+        try:
+            parts = Path(path).relative_to(Path(__file__).parent).parts[:-1]
+        except ValueError:
+            return False
+        if any(part in self.ignored_dirs or part.startswith('.') for part in parts):
+            return False
+        return os.path.splitext(path)[1] in self.watched_extensions
+    
+    def on_file_event(self):
+        """Restart the application in response to a filesystem event."""
+        if time.time() - self.last_restart < self.restart_cooldown:
+            return
+        self.restart_app()
+    
     def should_restart(self):
         """Check if the application should be restarted."""
         current_time = time.time()
@@ -42,36 +287,31 @@ class AutoReloader:
         if current_time - self.last_restart < self.restart_cooldown:
             return False
         
-        # Check for file changes
-        for file_path in self.get_python_files():
-            if self.has_file_changed(file_path):
-                return True
+        # Check for files modified since the last poll, stopping at the first hit
+        last_mtime = self._last_mtime
+        for entry in self._iter_py(str(Path(__file__).parent)):
+            try:
+                if entry.stat().st_mtime > last_mtime:
+                    self._last_mtime = current_time
+                    return True
+            except OSError:
+                continue
         
         return False
     
-    def get_python_files(self):
-        """Get all Python files in the project."""
-        python_files = []
-        project_dir = Path(__file__).parent
-        
-        for root, dirs, files in os.walk(project_dir):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if d not in self.ignored_dirs]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    python_files.append(Path(root) / file)
-        
-        return python_files
-    
-    def has_file_changed(self, file_path):
-        """Check if a file has been modified recently."""
+    def _iter_py(self, root):
+        """Yield DirEntry objects for all Python files under root."""
         try:
-            stat = file_path.stat()
-            # Check if file was modified in the last 2 seconds
-            return time.time() - stat.st_mtime < 2
-        except (OSError, FileNotFoundError):
-            return False
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in self.ignored_dirs or entry.name.startswith('.'):
+                            continue
+                        yield from self._iter_py(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry
+        except OSError:
+            return
     
     def restart_app(self):
         """Restart the application."""
@@ -89,7 +329,7 @@ class AutoReloader:
         
         # Start new process
         try:
-            self.process = subprocess.Popen([sys.executable, 'main.py'])
+            self.process = self._spawn()
             self.last_restart = time.time()
             print("✅ Application restarted successfully")
         except Exception as e:
@@ -108,6 +348,10 @@ class AutoReloader:
             except Exception as e:
                 print(f"⚠️  Error stopping process: {e}")
         
+        if self._zygote is not None:
+            self._zygote.close()
+            self._zygote = None
+        
         print("👋 Goodbye!")
 
 def main():
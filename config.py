@@ -1,7 +1,11 @@
 """
 Configuration and constants for the Task Tracker application.
 """
+import atexit
 import os
+import shutil
+import tempfile
+from functools import lru_cache
 from typing import Dict, Any
 
 # Database Configuration
@@ -9,9 +13,22 @@ DATABASE_NAME = 'tasks.db'
 
 # Store the database in the user's AppData\Local\MyTaskApp directory for persistence
 APP_NAME = 'SoulPlanner'
-appdata_dir = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), APP_NAME)
-os.makedirs(appdata_dir, exist_ok=True)
-DATABASE_PATH = os.path.join(appdata_dir, DATABASE_NAME)
+
+@lru_cache(maxsize=1)
+def get_database_path() -> str:
+    """Resolve the database path, creating the AppData directory on first use.
+    
+    When SOULPLANNER_TEST is set the test runs get a throwaway database in a
+    temporary directory instead of the user's real one, removed at exit along
+    with its WAL/SHM files.
+    """
+    if os.environ.get('SOULPLANNER_TEST'):
+        test_dir = tempfile.mkdtemp(prefix='soulplanner-test-')
+        atexit.register(shutil.rmtree, test_dir, True)
+        return os.path.join(test_dir, DATABASE_NAME)
+    appdata_dir = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), APP_NAME)
+    os.makedirs(appdata_dir, exist_ok=True)
+    return os.path.join(appdata_dir, DATABASE_NAME)
 
 # Application Settings
 APP_VERSION = "2.0.0"
@@ -99,4 +116,6 @@ MAX_OWNER_LENGTH = 50
 
 # Performance Settings
 BATCH_SIZE = 50  # Number of tasks to load at once
+STREAM_BATCH_SIZE = 200  # Rows fetched per batch when streaming query results
+PROJECT_TASKS_CACHE_SIZE = 16  # Project-filtered task listings kept between writes
 CACHE_DURATION = 300  # seconds 
\ No newline at end of file
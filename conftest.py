@@ -0,0 +1,14 @@
+"""
+Pytest configuration for the SoulPlanner test suite.
+"""
+import pytest
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "serial: run outside the parallel (pytest -n) pass")
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_ttkbootstrap():
+    """Import ttkbootstrap once per session (per xdist worker) and tear down the shared root."""
+    import _tk_root
+    yield
+    _tk_root.destroy_root()
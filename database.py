@@ -7,33 +7,112 @@ from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from contextlib import contextmanager
 import threading
+from functools import lru_cache, wraps
+from sqlalchemy import event, func, case, and_, text, Integer, delete, bindparam
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, create_engine, Session, select
 from models import Task, Project, TaskHistory, TaskStatus, TaskPriority
-from config import DATABASE_PATH, BATCH_SIZE
+from config import get_database_path, BATCH_SIZE, STREAM_BATCH_SIZE, PROJECT_TASKS_CACHE_SIZE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _overdue_clause(today: str):
+    """SQL predicate for incomplete tasks due before today.
+    
+    Due dates are stored as ISO ``YYYY-MM-DD`` text, so a plain string
+    comparison orders them correctly without parsing.
+    """
+    return and_(Task.due_date != "", Task.due_date < today, Task.completed == False)
+
+@lru_cache(maxsize=None)
+def _task_list_query(by_project: bool, by_status: bool, by_owner: bool, overdue_only: bool = False):
+    """Build the get_tasks SELECT for a given filter combination.
+    
+    Filter values, today's date, offset and limit are bound parameters, so
+    each possible statement is built once and reused from SQLAlchemy's
+    compiled cache.
+    """
+    query = select(Task)
+    if by_project:
+        query = query.where(Task.project == bindparam("project"))
+    if by_status:
+        query = query.where(Task.status == bindparam("status"))
+    if by_owner:
+        query = query.where(Task.owner == bindparam("owner"))
+    if overdue_only:
+        query = query.where(_overdue_clause(bindparam("today")))
+    
+    query = query.order_by(Task.created_date.desc())
+    return query.offset(bindparam("offset", type_=Integer)).limit(bindparam("limit", type_=Integer))
+
+def _new_task(task_data: Dict[str, Any]) -> Task:
+    """Build a Task, coercing status and priority like validation would.
+    
+    Table models skip validation in __init__, so only the two enum
+    validators are run here; other fields are left as given. Values outside
+    the enums are rejected by EnumCode when the row is written.
+    """
+    data = dict(task_data)
+    if "status" in data:
+        data["status"] = Task._coerce_status(data["status"])
+    if "priority" in data:
+        data["priority"] = Task._coerce_priority(data["priority"])
+    return Task(**data)
+
+def _invalidates_cache(method):
+    """Mark a DatabaseManager method as a write that invalidates read caches."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            # Bump after the method's session has committed
+            with self._lock:
+                self._write_version += 1
+    return wrapper
+
 class DatabaseManager:
     """Manages database connections and operations with connection pooling."""
     
-    def __init__(self, db_path: str = DATABASE_PATH):
-        self.db_path = db_path
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or get_database_path()
         self._lock = threading.Lock()
         self._engine = None
+        self._session_factory = None
+        self._fts_enabled = False
+        # Read caches keyed by write version, see _invalidates_cache
+        self._write_version = 0
+        self._stats_cache = {}
+        self._projects_cache = None
+        self._project_tasks_cache = {}
         self._init_database()
     
     def _init_database(self):
         """Initialize the database and create tables."""
         try:
-            self._engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+            self._engine = create_engine(
+                f"sqlite:///{self.db_path}",
+                echo=False,
+                query_cache_size=1200,
+                connect_args={"check_same_thread": False, "timeout": 30}
+            )
+            event.listen(self._engine, "connect", self._configure_connection)
+            self._session_factory = sessionmaker(
+                bind=self._engine,
+                class_=Session,
+                expire_on_commit=False
+            )
             
             # Check if database exists
             import os
             db_exists = os.path.exists(self.db_path)
             
             if db_exists:
+                # Migrate rows in place first; a failure here must not fall
+                # through to the drop-and-recreate branch below
+                self._migrate_enum_codes()
                 # Check if we need to migrate the schema
                 try:
                     # Try to connect and check if tables exist
@@ -51,6 +130,8 @@ class DatabaseManager:
                         logger.info(f"Backed up old database to {backup_path}")
                     
                     # Drop and recreate tables to ensure new schema
+                    with self._engine.begin() as conn:
+                        conn.exec_driver_sql("DROP TABLE IF EXISTS task_fts")
                     SQLModel.metadata.drop_all(self._engine)
                     logger.info("Dropped old database schema")
                     SQLModel.metadata.create_all(self._engine)
@@ -59,15 +140,139 @@ class DatabaseManager:
                 # Create new database
                 SQLModel.metadata.create_all(self._engine)
                 logger.info(f"Created new database at {self.db_path}")
+            
+            self._ensure_indexes()
+            self._create_readable_view()
+            self._fts_enabled = self._setup_fts()
                 
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
     
+    def _ensure_indexes(self):
+        """Create any model indexes missing from an existing database."""
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self._engine, checkfirst=True)
+    
+    def _migrate_enum_codes(self):
+        """Rewrite status/priority stored as enum names to their integer codes.
+        
+        Text outside the enum is mapped to the field's default member and
+        logged rather than left to fail the NOT NULL constraint.
+        """
+        with self._engine.begin() as conn:
+            columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(task)")}
+            for column, enum_cls in (("status", TaskStatus), ("priority", TaskPriority)):
+                if column not in columns:
+                    continue
+                members = list(enum_cls)
+                default_code = members.index(Task.model_fields[column].default)
+                known = ", ".join(f"'{member.name}', '{member.value}'" for member in members)
+                pending = f"typeof({column}) = 'text' AND CAST({column} AS INTEGER) || '' != {column}"
+                for (value,) in conn.exec_driver_sql(
+                    f"SELECT DISTINCT {column} FROM task WHERE {pending} AND {column} NOT IN ({known})"
+                ):
+                    logger.warning(f"Unknown task {column} {value!r}; migrating to {members[default_code].value!r}")
+                whens = " ".join(
+                    f"WHEN '{member.name}' THEN {code} WHEN '{member.value}' THEN {code}"
+                    for code, member in enumerate(members)
+                )
+                conn.exec_driver_sql(
+                    f"UPDATE task SET {column} = CASE {column} {whens} ELSE {default_code} END WHERE {pending}"
+                )
+    
+    def _create_readable_view(self):
+        """Create task_readable, which shows status and priority as text for ad-hoc SQL."""
+        status_sql = Task.__table__.c.status.type.case_sql("status")
+        priority_sql = Task.__table__.c.priority.type.case_sql("priority")
+        with self._engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE VIEW IF NOT EXISTS task_readable AS "
+                f"SELECT task.*, {status_sql} AS status_label, {priority_sql} AS priority_label FROM task"
+            )
+    
+    def _setup_fts(self) -> bool:
+        """Create the full-text search index over task text columns.
+        
+        Returns False when the SQLite build lacks FTS5 or the trigram
+        tokenizer, in which case search falls back to LIKE scans.
+        """
+        try:
+            with self._engine.begin() as conn:
+                exists = conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='task_fts'"
+                ).first()
+                if exists:
+                    return True
+                
+                conn.exec_driver_sql(
+                    "CREATE VIRTUAL TABLE task_fts USING fts5("
+                    "title, description, notes, "
+                    "content='task', content_rowid='id', tokenize='trigram')"
+                )
+                conn.exec_driver_sql(
+                    "CREATE TRIGGER IF NOT EXISTS task_fts_ai AFTER INSERT ON task BEGIN "
+                    "INSERT INTO task_fts(rowid, title, description, notes) "
+                    "VALUES (new.id, new.title, new.description, new.notes); END"
+                )
+                conn.exec_driver_sql(
+                    "CREATE TRIGGER IF NOT EXISTS task_fts_ad AFTER DELETE ON task BEGIN "
+                    "INSERT INTO task_fts(task_fts, rowid, title, description, notes) "
+                    "VALUES ('delete', old.id, old.title, old.description, old.notes); END"
+                )
+                conn.exec_driver_sql(
+                    "CREATE TRIGGER IF NOT EXISTS task_fts_au AFTER UPDATE ON task BEGIN "
+                    "INSERT INTO task_fts(task_fts, rowid, title, description, notes) "
+                    "VALUES ('delete', old.id, old.title, old.description, old.notes); "
+                    "INSERT INTO task_fts(rowid, title, description, notes) "
+                    "VALUES (new.id, new.title, new.description, new.notes); END"
+                )
+                # Index rows that existed before the search table was created
+                conn.exec_driver_sql("INSERT INTO task_fts(task_fts) VALUES ('rebuild')")
+            logger.info("Full-text search index ready")
+            return True
+        except Exception as e:
+            logger.warning(f"Full-text search unavailable, using LIKE search: {e}")
+            return False
+    
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record):
+        """Apply SQLite performance pragmas to each new connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            # WAL lets commits append to the log instead of fsyncing the main file
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA cache_size=-20000")
+            cursor.execute("PRAGMA foreign_keys=ON")
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _sanitize(task: Task) -> Dict[str, Any]:
+        """Convert a Task row to a plain dict with normalized field types."""
+        # Read the instance dict directly; task.dict() would re-run Pydantic serialization
+        task_dict = {k: v for k, v in task.__dict__.items() if not k.startswith('_')}
+        # Ensure due_date is a string or None
+        due_date = task_dict.get('due_date')
+        if due_date is not None:
+            task_dict['due_date'] = str(due_date)
+        # Ensure estimated_hours is a number or None
+        estimated_hours = task_dict.get('estimated_hours')
+        if estimated_hours is not None:
+            try:
+                task_dict['estimated_hours'] = float(estimated_hours)
+            except (ValueError, TypeError):
+                task_dict['estimated_hours'] = None
+        return task_dict
+    
     @contextmanager
     def get_session(self):
         """Context manager for database sessions."""
-        session = Session(self._engine)
+        session = self._session_factory()
         try:
             yield session
             session.commit()
@@ -78,11 +283,12 @@ class DatabaseManager:
         finally:
             session.close()
     
+    @_invalidates_cache
     def add_task(self, task_data: Dict[str, Any]) -> Optional[int]:
         """Add a new task to the database."""
         try:
             with self.get_session() as session:
-                task = Task(**task_data)
+                task = _new_task(task_data)
                 session.add(task)
                 session.commit()
                 session.refresh(task)
@@ -92,42 +298,60 @@ class DatabaseManager:
             logger.error(f"Failed to add task: {e}")
             return None
     
+    @_invalidates_cache
+    def add_tasks_bulk(self, tasks_data: List[Dict[str, Any]]) -> int:
+        """Add many tasks in a single transaction. Returns the number added."""
+        try:
+            with self.get_session() as session:
+                # Build models so defaults and enum coercion match add_task
+                session.add_all([_new_task(task_data) for task_data in tasks_data])
+                session.commit()
+                logger.info(f"Added {len(tasks_data)} tasks")
+                return len(tasks_data)
+        except Exception as e:
+            logger.error(f"Failed to add tasks: {e}")
+            return 0
+    
     def get_tasks(self, project: Optional[str] = None, 
                   status: Optional[str] = None,
                   owner: Optional[str] = None,
                   limit: int = BATCH_SIZE,
-                  offset: int = 0) -> List[Dict[str, Any]]:
-        """Get tasks with optional filtering and pagination."""
+                  offset: int = 0,
+                  overdue_only: bool = False) -> List[Dict[str, Any]]:
+        """Get tasks with optional filtering and pagination.
+        
+        With ``overdue_only`` the overdue check runs in SQL rather than per row.
+        Listings filtered by project alone are cached until the next write.
+        """
         try:
+            cache_key = None
+            if project and not (status or owner or overdue_only):
+                cache_key = (project, limit, offset)
+                version = self._write_version
+                cached = self._project_tasks_cache.get(cache_key)
+                if cached and cached[0] == version:
+                    return [dict(task) for task in cached[1]]
+            
             with self.get_session() as session:
-                query = select(Task)
-                
+                query = _task_list_query(bool(project), bool(status), bool(owner), overdue_only)
+                params = {"offset": offset, "limit": limit}
+                if overdue_only:
+                    params["today"] = datetime.now().strftime("%Y-%m-%d")
                 if project:
-                    query = query.where(Task.project == project)
+                    params["project"] = project
                 if status:
-                    query = query.where(Task.status == status)
+                    params["status"] = status
                 if owner:
-                    query = query.where(Task.owner == owner)
-                
-                query = query.order_by(Task.created_date.desc())
-                query = query.offset(offset).limit(limit)
+                    params["owner"] = owner
                 
-                tasks = session.exec(query).all()
-                # Sanitize task data to ensure proper types
-                sanitized_tasks = []
-                for task in tasks:
-                    task_dict = task.dict()
-                    # Ensure due_date is a string or None
-                    if task_dict.get('due_date') is not None:
-                        task_dict['due_date'] = str(task_dict['due_date'])
-                    # Ensure estimated_hours is a number or None
-                    if task_dict.get('estimated_hours') is not None:
-                        try:
-                            task_dict['estimated_hours'] = float(task_dict['estimated_hours'])
-                        except (ValueError, TypeError):
-                            task_dict['estimated_hours'] = None
-                    sanitized_tasks.append(task_dict)
-                return sanitized_tasks
+                tasks = session.exec(query.execution_options(yield_per=STREAM_BATCH_SIZE), params=params)
+                result = [self._sanitize(task) for task in tasks]
+                if cache_key:
+                    if len(self._project_tasks_cache) >= PROJECT_TASKS_CACHE_SIZE:
+                        self._project_tasks_cache.clear()
+                    self._project_tasks_cache[cache_key] = (version, result)
+                    return [dict(task) for task in result]
+                return result
         except Exception as e:
             logger.error(f"Failed to get tasks: {e}")
             return []
@@ -136,32 +360,26 @@ class DatabaseManager:
         """Search tasks by title, description, or notes."""
         try:
             with self.get_session() as session:
-                query = select(Task).where(
-                    (Task.title.contains(search_term)) |
-                    (Task.description.contains(search_term)) |
-                    (Task.notes.contains(search_term))
-                )
+                # Trigram FTS needs at least three characters to match
+                if self._fts_enabled and len(search_term) >= 3:
+                    fts_query = '"' + search_term.replace('"', '""') + '"'
+                    matches = text(
+                        "SELECT rowid FROM task_fts WHERE task_fts MATCH :q"
+                    ).bindparams(q=fts_query).columns(rowid=Integer)
+                    query = select(Task).where(Task.id.in_(matches))
+                else:
+                    query = select(Task).where(
+                        (Task.title.contains(search_term)) |
+                        (Task.description.contains(search_term)) |
+                        (Task.notes.contains(search_term))
+                    )
                 
                 if project:
                     query = query.where(Task.project == project)
                 
                 query = query.order_by(Task.created_date.desc())
-                tasks = session.exec(query).all()
-                # Sanitize task data to ensure proper types
-                sanitized_tasks = []
-                for task in tasks:
-                    task_dict = task.dict()
-                    # Ensure due_date is a string or None
-                    if task_dict.get('due_date') is not None:
-                        task_dict['due_date'] = str(task_dict['due_date'])
-                    # Ensure estimated_hours is a number or None
-                    if task_dict.get('estimated_hours') is not None:
-                        try:
-                            task_dict['estimated_hours'] = float(task_dict['estimated_hours'])
-                        except (ValueError, TypeError):
-                            task_dict['estimated_hours'] = None
-                    sanitized_tasks.append(task_dict)
-                return sanitized_tasks
+                tasks = session.exec(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+                return [self._sanitize(task) for task in tasks]
         except Exception as e:
             logger.error(f"Failed to search tasks: {e}")
             return []
@@ -171,23 +389,12 @@ class DatabaseManager:
         try:
             with self.get_session() as session:
                 task = session.get(Task, task_id)
-                if task:
-                    task_dict = task.dict()
-                    # Ensure due_date is a string or None
-                    if task_dict.get('due_date') is not None:
-                        task_dict['due_date'] = str(task_dict['due_date'])
-                    # Ensure estimated_hours is a number or None
-                    if task_dict.get('estimated_hours') is not None:
-                        try:
-                            task_dict['estimated_hours'] = float(task_dict['estimated_hours'])
-                        except (ValueError, TypeError):
-                            task_dict['estimated_hours'] = None
-                    return task_dict
-                return None
+                return self._sanitize(task) if task else None
         except Exception as e:
             logger.error(f"Failed to get task {task_id}: {e}")
             return None
     
+    @_invalidates_cache
     def update_task(self, task_id: int, **kwargs) -> bool:
         """Update a task with change tracking."""
         try:
@@ -197,23 +404,27 @@ class DatabaseManager:
                     return False
                 
                 # Track changes for history
-                changes = []
+                changed_date = datetime.now().isoformat(" ", "seconds")
+                history_records = []
                 for field, new_value in kwargs.items():
                     if hasattr(task, field) and getattr(task, field) != new_value:
                         old_value = getattr(task, field)
                         setattr(task, field, new_value)
                         
                         # Record change in history
-                        history = TaskHistory(
+                        history_records.append(TaskHistory(
                             task_id=task_id,
                             field_name=field,
                             old_value=str(old_value) if old_value is not None else None,
                             new_value=str(new_value) if new_value is not None else None,
-                            changed_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        )
-                        session.add(history)
-                        changes.append(field)
+                            changed_date=changed_date
+                        ))
+                
+                # Flush all history rows together so they go out as one batched INSERT
+                if history_records:
+                    session.add_all(history_records)
                 
+                changes = [record.field_name for record in history_records]
                 if changes:
                     logger.info(f"Task {task_id} updated: {', '.join(changes)}")
                 
@@ -222,22 +433,18 @@ class DatabaseManager:
             logger.error(f"Failed to update task {task_id}: {e}")
             return False
     
+    @_invalidates_cache
     def delete_task(self, task_id: int) -> bool:
         """Delete a task and its history."""
         try:
             with self.get_session() as session:
-                task = session.get(Task, task_id)
-                if not task:
+                # Delete the task
+                result = session.exec(delete(Task).where(Task.id == task_id))
+                if not result.rowcount:
                     return False
                 
-                # Delete associated history first
-                history_query = select(TaskHistory).where(TaskHistory.task_id == task_id)
-                history_records = session.exec(history_query).all()
-                for history_record in history_records:
-                    session.delete(history_record)
-                
-                # Delete the task
-                session.delete(task)
+                # Delete associated history in one statement
+                session.exec(delete(TaskHistory).where(TaskHistory.task_id == task_id))
                 session.commit()
                 logger.info(f"Task {task_id} deleted")
                 return True
@@ -245,33 +452,61 @@ class DatabaseManager:
             logger.error(f"Failed to delete task {task_id}: {e}")
             return False
     
+    @_invalidates_cache
+    def delete_tasks_by_project(self, project_name: str) -> int:
+        """Delete every task in a project, and its history, without touching the project row."""
+        try:
+            with self.get_session() as session:
+                project_task_ids = select(Task.id).where(Task.project == project_name)
+                session.exec(delete(TaskHistory).where(TaskHistory.task_id.in_(project_task_ids)))
+                result = session.exec(delete(Task).where(Task.project == project_name))
+                session.commit()
+                return result.rowcount
+        except Exception as e:
+            logger.error(f"Failed to delete tasks for project {project_name}: {e}")
+            return 0
+    
     def get_task_statistics(self, project: Optional[str] = None) -> Dict[str, Any]:
         """Get task statistics for dashboard."""
         try:
+            today = datetime.now().strftime("%Y-%m-%d")
+            version = self._write_version
+            cached = self._stats_cache.get(project)
+            if cached and cached[0] == version and cached[1] == today:
+                return cached[2]
+            
             with self.get_session() as session:
-                query = select(Task)
+                overdue_col = case((_overdue_clause(today), 1), else_=0).label("overdue")
+                query = select(Task.status, Task.completed, overdue_col, func.count())
                 if project:
                     query = query.where(Task.project == project)
+                query = query.group_by(Task.status, Task.completed, overdue_col)
                 
-                tasks = session.exec(query).all()
+                rows = session.exec(query).all()
                 
-                total = len(tasks)
-                completed = len([t for t in tasks if t.completed])
-                overdue = len([t for t in tasks if t.due_date and 
-                             datetime.strptime(t.due_date, "%Y-%m-%d") < datetime.now() and 
-                             not t.completed])
+                total = 0
+                completed = 0
+                overdue = 0
+                status_counts = {status.value: 0 for status in TaskStatus}
+                for status, is_completed, is_overdue, count in rows:
+                    total += count
+                    if is_completed:
+                        completed += count
+                    if is_overdue:
+                        overdue += count
+                    status_value = getattr(status, 'value', status)
+                    if status_value in status_counts:
+                        status_counts[status_value] += count
                 
-                status_counts = {}
-                for status in TaskStatus:
-                    status_counts[status.value] = len([t for t in tasks if t.status == status])
-                
-                return {
+                result = {
                     "total": total,
                     "completed": completed,
                     "overdue": overdue,
                     "status_counts": status_counts,
                     "completion_rate": (completed / total * 100) if total > 0 else 0
                 }
+                self._stats_cache[project] = (version, today, result)
+                return result
         except Exception as e:
             logger.error(f"Failed to get statistics: {e}")
             return {"total": 0, "completed": 0, "overdue": 0, "status_counts": {}, "completion_rate": 0}
@@ -279,13 +514,21 @@ class DatabaseManager:
     def get_projects(self) -> List[Dict[str, Any]]:
         """Get all projects."""
         try:
+            version = self._write_version
+            cached = self._projects_cache
+            if cached and cached[0] == version:
+                return list(cached[1])
+            
             with self.get_session() as session:
                 projects = session.exec(select(Project).where(Project.is_active == True)).all()
-                return [project.dict() for project in projects]
+                result = [project.dict() for project in projects]
+                self._projects_cache = (version, result)
+                return list(result)
         except Exception as e:
             logger.error(f"Failed to get projects: {e}")
             return []
     
+    @_invalidates_cache
     def add_project(self, project_data: Dict[str, Any]) -> Optional[int]:
         """Add a new project."""
         try:
@@ -299,6 +542,7 @@ class DatabaseManager:
             logger.error(f"Failed to add project: {e}")
             return None
     
+    @_invalidates_cache
     def delete_project(self, project_name: str) -> bool:
         """Deactivate (soft-delete) a project by name."""
         try:
@@ -314,14 +558,15 @@ class DatabaseManager:
             logger.error(f"Failed to delete project: {e}")
             return False
     
+    @_invalidates_cache
     def delete_project_permanently(self, project_name: str) -> bool:
         """Permanently delete a project and all its tasks from the database."""
         try:
             with self.get_session() as session:
-                # Delete tasks associated with the project
-                tasks = session.exec(select(Task).where(Task.project == project_name)).all()
-                for task in tasks:
-                    session.delete(task)
+                # Delete tasks associated with the project, along with their history
+                project_task_ids = select(Task.id).where(Task.project == project_name)
+                session.exec(delete(TaskHistory).where(TaskHistory.task_id.in_(project_task_ids)))
+                session.exec(delete(Task).where(Task.project == project_name))
                 # Delete the project itself
                 project = session.exec(select(Project).where(Project.name == project_name)).first()
                 if project:
@@ -338,26 +583,9 @@ class DatabaseManager:
         try:
             today = datetime.now().strftime("%Y-%m-%d")
             with self.get_session() as session:
-                query = select(Task).where(
-                    (Task.due_date < today) & 
-                    (Task.completed == False)
-                )
-                tasks = session.exec(query).all()
-                # Sanitize task data to ensure proper types
-                sanitized_tasks = []
-                for task in tasks:
-                    task_dict = task.dict()
-                    # Ensure due_date is a string or None
-                    if task_dict.get('due_date') is not None:
-                        task_dict['due_date'] = str(task_dict['due_date'])
-                    # Ensure estimated_hours is a number or None
-                    if task_dict.get('estimated_hours') is not None:
-                        try:
-                            task_dict['estimated_hours'] = float(task_dict['estimated_hours'])
-                        except (ValueError, TypeError):
-                            task_dict['estimated_hours'] = None
-                    sanitized_tasks.append(task_dict)
-                return sanitized_tasks
+                query = select(Task).where(_overdue_clause(today))
+                tasks = session.exec(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+                return [self._sanitize(task) for task in tasks]
         except Exception as e:
             logger.error(f"Failed to get overdue tasks: {e}")
             return []
@@ -376,6 +604,21 @@ class DatabaseManager:
             logger.error(f"Failed to get task history: {e}")
             return []
 
+    @_invalidates_cache
+    def truncate_all(self) -> bool:
+        """Delete every task, project and history row in one transaction (used by the tests)."""
+        try:
+            with self.get_session() as session:
+                session.exec(delete(TaskHistory))
+                session.exec(delete(Task))
+                session.exec(delete(Project))
+                session.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Failed to truncate tables: {e}")
+            return False
+    
+    @_invalidates_cache
     def delete_orphan_learning_tasks(self):
         """Delete all tasks with project='learning' (case-insensitive) if the project does not exist in the Project table."""
         try:
@@ -384,9 +627,7 @@ class DatabaseManager:
                 project = session.exec(select(Project).where(Project.name.ilike('learning'))).first()
                 if not project:
                     # Delete all tasks with project='learning' (case-insensitive)
-                    tasks = session.exec(select(Task).where(Task.project.ilike('learning'))).all()
-                    for task in tasks:
-                        session.delete(task)
+                    session.exec(delete(Task).where(Task.project.ilike('learning')))
                     session.commit()
                     return True
                 return False
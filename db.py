@@ -1,59 +1,39 @@
-import sqlite3
-DB_NAME = 'tasks.db'
+"""
+Legacy task helpers kept for backward compatibility.
+All calls delegate to database.db_manager so there is a single schema and connection pool.
+"""
+from database import db_manager
+
+# Legacy dict keys mapped to Task model fields
+_FIELD_MAP = {'task': 'title', 'due': 'due_date'}
 
 def init_db():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS tasks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            owner TEXT,
-            status TEXT,
-            due_date TEXT,
-            notes TEXT,
-            completed INTEGER DEFAULT 0,
-            project TEXT
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    # Schema is created by DatabaseManager on import
+    pass
 
 def add_task(task):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('INSERT INTO tasks (title, owner, status, due_date, notes, completed, project) VALUES (?, ?, ?, ?, ?, ?, ?)',
-              (task['task'], task['owner'], task['status'], task['due'], task['notes'], 0, task.get('project', 'learning')))
-    conn.commit()
-    conn.close()
+    return db_manager.add_task({
+        'title': task['task'],
+        'owner': task['owner'],
+        'status': task['status'],
+        'due_date': task['due'],
+        'notes': task['notes'],
+        'completed': False,
+        'project': task.get('project', 'learning')
+    })
 
 def get_tasks(project=None):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    if project:
-        c.execute('SELECT id, title, owner, status, due_date, notes, completed, project FROM tasks WHERE project=?', (project,))
-    else:
-        c.execute('SELECT id, title, owner, status, due_date, notes, completed, project FROM tasks')
-    rows = c.fetchall()
-    conn.close()
+    # SQLite treats a negative LIMIT as unbounded
+    tasks = db_manager.get_tasks(project=project, limit=-1)
     return [
         {
-            'id': row[0], 'task': row[1], 'owner': row[2], 'status': row[3],
-            'due': row[4], 'notes': row[5], 'completed': row[6], 'project': row[7]
-        } for row in rows
+            'id': t['id'], 'task': t['title'], 'owner': t['owner'], 'status': t['status'],
+            'due': t['due_date'], 'notes': t['notes'], 'completed': int(t['completed']), 'project': t['project']
+        } for t in tasks
     ]
 
 def update_task(task_id, **kwargs):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    for k, v in kwargs.items():
-        c.execute(f'UPDATE tasks SET {k}=? WHERE id=?', (v, task_id))
-    conn.commit()
-    conn.close()
+    return db_manager.update_task(task_id, **{_FIELD_MAP.get(k, k): v for k, v in kwargs.items()})
 
 def delete_task(task_id):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute('DELETE FROM tasks WHERE id=?', (task_id,))
-    conn.commit()
-    conn.close() 
\ No newline at end of file
+    return db_manager.delete_task(task_id)
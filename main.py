@@ -4,6 +4,7 @@ Main entry point for the SoulPlanner Task Tracker application.
 import sys
 import os
 import traceback
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 import ttkbootstrap as tb
@@ -43,13 +44,11 @@ def setup_exception_handling():
 def check_dependencies():
     """Check if all required dependencies are available."""
     required_packages = ['ttkbootstrap', 'sqlmodel']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only locates the package; it doesn't run its __init__
+    missing_packages = [
+        package for package in required_packages
+        if importlib.util.find_spec(package) is None
+    ]
     
     if missing_packages:
         error_msg = f"Missing required packages: {', '.join(missing_packages)}\n\n"
@@ -2,11 +2,35 @@
 Data models for the Task Tracker application.
 """
 from sqlmodel import SQLModel, Field
+from sqlmodel.sql.expression import Select, SelectOfScalar
+from sqlalchemy import Index, SmallInteger
+from sqlalchemy.types import TypeDecorator
+from pydantic import ConfigDict, field_validator
 from typing import Optional
-from datetime import datetime
 from enum import Enum
+import time
 import uuid
 
+# Older sqlmodel releases leave inherit_cache unset on their Select subclasses,
+# which makes SQLAlchemy skip its compiled-statement cache for every query.
+for _select_cls in (Select, SelectOfScalar):
+    if "inherit_cache" not in _select_cls.__dict__:
+        _select_cls.inherit_cache = True
+
+# [date string, time it was computed]; refreshed at most once a second
+_today_cache = [None, 0.0]
+
+def _today() -> str:
+    """Return today's date as YYYY-MM-DD, reusing the last value for up to a second."""
+    now = time.time()
+    if now - _today_cache[1] > 1:
+        _today_cache[:] = [time.strftime("%Y-%m-%d", time.localtime(now)), now]
+    return _today_cache[0]
+
+def _now() -> str:
+    """Return the current local time as YYYY-MM-DD HH:MM:SS."""
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
 class TaskStatus(str, Enum):
     """Enumeration for task status values."""
     NOT_STARTED = "Not Started"
@@ -21,17 +45,68 @@ class TaskPriority(str, Enum):
     HIGH = "High"
     URGENT = "Urgent"
 
+# Value -> member lookups so coercion is a single dict hit instead of Enum.__call__
+_STATUS_BY_VALUE = {member.value: member for member in TaskStatus}
+_PRIORITY_BY_VALUE = {member.value: member for member in TaskPriority}
+
+class EnumCode(TypeDecorator):
+    """Store a str Enum as a small integer code: its position in the Enum.
+    
+    Codes follow member definition order, so new members must be appended.
+    Rows written before the switch to codes hold the member name and are
+    still read correctly.
+    """
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_cls):
+        super().__init__()
+        self.enum_cls = enum_cls
+        self._members = list(enum_cls)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        member = value if isinstance(value, self.enum_cls) else self.enum_cls(value)
+        return self._codes[member]
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return self._members[int(value)]
+        except ValueError:
+            return self.enum_cls[value]
+    
+    def case_sql(self, column: str) -> str:
+        """SQL CASE expression turning the stored code back into the display value."""
+        whens = " ".join(f"WHEN {code} THEN '{member.value}'" for code, member in enumerate(self._members))
+        return f"CASE {column} {whens} END"
+
 class Task(SQLModel, table=True):
     """Task model representing a single task in the system."""
     
+    __table_args__ = (
+        # Covers the dashboard statistics aggregation
+        Index("ix_task_stat", "project", "status", "completed", "due_date"),
+        # Filtered, created_date-ordered listing in get_tasks
+        Index("ix_task_project_status_created", "project", "status", "created_date"),
+        # Status-only listings, which the project-led indexes cannot serve
+        Index("ix_task_status_created", "status", "created_date"),
+        # Overdue lookups
+        Index("ix_task_due_completed", "due_date", "completed"),
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=100, description="Task title")
     description: Optional[str] = Field(default=None, max_length=500, description="Task description")
     owner: Optional[str] = Field(default=None, max_length=50, description="Task owner")
-    status: TaskStatus = Field(default=TaskStatus.NOT_STARTED, description="Current task status")
-    priority: TaskPriority = Field(default=TaskPriority.MEDIUM, description="Task priority level")
+    status: TaskStatus = Field(default=TaskStatus.NOT_STARTED, sa_type=EnumCode(TaskStatus), description="Current task status")
+    priority: TaskPriority = Field(default=TaskPriority.MEDIUM, sa_type=EnumCode(TaskPriority), description="Task priority level")
     due_date: Optional[str] = Field(default=None, description="Due date in YYYY-MM-DD format")
-    created_date: str = Field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d"), description="Creation date")
+    created_date: str = Field(default_factory=_today, description="Creation date")
     completed_date: Optional[str] = Field(default=None, description="Completion date")
     notes: Optional[str] = Field(default=None, max_length=1000, description="Additional notes")
     completed: bool = Field(default=False, description="Completion status")
@@ -40,10 +115,19 @@ class Task(SQLModel, table=True):
     estimated_hours: Optional[float] = Field(default=None, ge=0, description="Estimated hours to complete")
     actual_hours: Optional[float] = Field(default=None, ge=0, description="Actual hours spent")
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        validate_assignment = True
+    # Table models skip validation in __init__, so database.add_task runs the
+    # enum coercion itself; assignment validation stays off for attribute writes
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=False)
+    
+    @field_validator("status", mode="before")
+    @classmethod
+    def _coerce_status(cls, v):
+        return v if v.__class__ is TaskStatus else _STATUS_BY_VALUE.get(v, v)
+    
+    @field_validator("priority", mode="before")
+    @classmethod
+    def _coerce_priority(cls, v):
+        return v if v.__class__ is TaskPriority else _PRIORITY_BY_VALUE.get(v, v)
 
 class Project(SQLModel, table=True):
     """Project model for organizing tasks."""
@@ -51,17 +135,21 @@ class Project(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=50, description="Project name")
     description: Optional[str] = Field(default=None, max_length=200, description="Project description")
-    created_date: str = Field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d"))
+    created_date: str = Field(default_factory=_today)
     is_active: bool = Field(default=True, description="Project active status")
     color: Optional[str] = Field(default="#2563eb", description="Project color in hex format")
 
 class TaskHistory(SQLModel, table=True):
     """Task history model for tracking changes."""
     
+    __table_args__ = (
+        Index("ix_history_task_date", "task_id", "changed_date"),
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     task_id: int = Field(description="Reference to the task")
     field_name: str = Field(max_length=50, description="Name of the changed field")
     old_value: Optional[str] = Field(default=None, max_length=500, description="Previous value")
     new_value: Optional[str] = Field(default=None, max_length=500, description="New value")
-    changed_date: str = Field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    changed_date: str = Field(default_factory=_now)
     changed_by: Optional[str] = Field(default=None, max_length=50, description="User who made the change") 
\ No newline at end of file
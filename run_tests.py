@@ -6,40 +6,60 @@ import sys
 import os
 import time
 import threading
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def run_component_tests():
-    """Run tests for individual UI components."""
+class SuiteResults:
+    """Result lines for one test suite plus running pass/fail counts."""
+    
+    def __init__(self):
+        self.lines = []
+        self.passed = 0
+        self.failed = 0
+    
+    def add_pass(self, line: str):
+        self.lines.append(line)
+        self.passed += 1
+        print(line)
+    
+    def add_fail(self, line: str):
+        self.lines.append(line)
+        self.failed += 1
+        print(line)
+    
+    def summary(self) -> str:
+        return f"✅ {self.passed} passed, ❌ {self.failed} failed"
+
+def run_component_tests(root):
+    """Run tests for individual UI components in a window on the shared root."""
     print("🧪 Running Component Tests...")
     
     try:
         import tkinter as tk
-        import ttkbootstrap as tb
         from ui.components import ModernEntry, ModernButton, SearchEntry, StatusPill, PriorityBadge
-        from config import THEMES, FONTS
+        from config import FONTS
         
         # Create test window
-        root = tb.Window(themename=THEMES["light"]["name"])
-        root.title("Component Tests")
-        root.geometry("800x600")
+        window = tk.Toplevel(root)
+        window.title("Component Tests")
+        window.geometry("800x600")
         
-        test_frame = tk.Frame(root, padx=20, pady=20)
+        test_frame = tk.Frame(window, padx=20, pady=20)
         test_frame.pack(fill="both", expand=True)
         
-        results = []
+        results = SuiteResults()
         
         def test_component(name: str, test_func):
             """Test a component and record results."""
             try:
                 test_func()
-                results.append(f"✅ {name}: PASS")
-                print(f"✅ {name}: PASS")
+                results.add_pass(f"✅ {name}: PASS")
             except Exception as e:
-                results.append(f"❌ {name}: FAIL - {str(e)}")
-                print(f"❌ {name}: FAIL - {str(e)}")
+                results.add_fail(f"❌ {name}: FAIL - {str(e)}")
         
         # Test ModernEntry
         def test_modern_entry():
@@ -107,9 +127,11 @@ def run_component_tests():
         def test_search_entry():
             try:
                 search_calls = []
+                search_done = tk.BooleanVar(root, value=False)
                 
                 def on_search(term):
                     search_calls.append(term)
+                    search_done.set(True)
                 
                 entry = SearchEntry(test_frame, on_search)
                 entry.pack(pady=5)
@@ -122,8 +144,10 @@ def run_component_tests():
                 entry.insert(0, "test")
                 entry.event_generate("<KeyRelease>")
                 
-                # Wait for debounce
-                time.sleep(0.4)
+                # Let the event loop run until the debounced search fires (or time out)
+                timeout_id = root.after(500, lambda: search_done.set(True))
+                root.wait_variable(search_done)
+                root.after_cancel(timeout_id)
                 
                 # Should have called search once
                 assert len(search_calls) == 1
@@ -170,18 +194,18 @@ def run_component_tests():
         test_component("PriorityBadge", test_priority_badge)
         
         # Display results
-        results_text = "\n".join(results)
+        results_text = "\n".join(results.lines)
         results_label = tk.Label(test_frame, text=results_text, font=FONTS["primary"], justify="left")
         results_label.pack(pady=20)
         
         # Close button
-        close_btn = ModernButton(test_frame, text="Close Tests", command=root.destroy)
+        close_btn = ModernButton(test_frame, text="Close Tests", command=window.destroy)
         close_btn.pack(pady=10)
         
         print(f"\n📊 Component Test Results:\n{results_text}")
-        print(f"\n✅ {len([r for r in results if 'PASS' in r])} passed, ❌ {len([r for r in results if 'FAIL' in r])} failed")
+        print(f"\n{results.summary()}")
         
-        root.mainloop()
+        window.wait_window()
         
     except Exception as e:
         print(f"❌ Component tests failed: {e}")
@@ -195,17 +219,15 @@ def run_functionality_tests():
         from utils import validate_task_data, format_date, is_overdue
         from models import TaskStatus, TaskPriority
         
-        results = []
+        results = SuiteResults()
         
         def test_function(name: str, test_func):
             """Test a function and record results."""
             try:
                 test_func()
-                results.append(f"✅ {name}: PASS")
-                print(f"✅ {name}: PASS")
+                results.add_pass(f"✅ {name}: PASS")
             except Exception as e:
-                results.append(f"❌ {name}: FAIL - {str(e)}")
-                print(f"❌ {name}: FAIL - {str(e)}")
+                results.add_fail(f"❌ {name}: FAIL - {str(e)}")
         
         # Test database operations
         def test_database_operations():
@@ -277,49 +299,49 @@ def run_functionality_tests():
         test_function("Utility Functions", test_utility_functions)
         
         print(f"\n📊 Functionality Test Results:")
-        for result in results:
+        for result in results.lines:
             print(result)
-        print(f"\n✅ {len([r for r in results if 'PASS' in r])} passed, ❌ {len([r for r in results if 'FAIL' in r])} failed")
+        print(f"\n{results.summary()}")
         
     except Exception as e:
         print(f"❌ Functionality tests failed: {e}")
 
-def run_integration_tests():
-    """Run integration tests for the complete application."""
+def run_integration_tests(root):
+    """Run integration tests in a window on the shared root."""
     print("\n🔗 Running Integration Tests...")
     
     try:
         import tkinter as tk
-        import ttkbootstrap as tb
+        import tkinter.font as tkfont
         from ui.task_dialog import TaskDialog
         from ui.task_table import ModernTaskTable
         from ui.theme_manager import ThemeManager
-        from config import THEMES
         
         # Create test window
-        root = tb.Window(themename=THEMES["light"]["name"])
-        root.title("Integration Tests")
-        root.geometry("1000x700")
+        window = tk.Toplevel(root)
+        window.title("Integration Tests")
+        window.geometry("1000x700")
         
-        test_frame = tk.Frame(root, padx=20, pady=20)
+        test_frame = tk.Frame(window, padx=20, pady=20)
         test_frame.pack(fill="both", expand=True)
         
-        results = []
+        # One Tk font object for the suite rather than a tuple resolved per widget
+        results_font = tkfont.Font(root=root, family="Segoe UI", size=10)
+        
+        results = SuiteResults()
         
         def test_integration(name: str, test_func):
             """Test integration functionality."""
             try:
                 test_func()
-                results.append(f"✅ {name}: PASS")
-                print(f"✅ {name}: PASS")
+                results.add_pass(f"✅ {name}: PASS")
             except Exception as e:
-                results.append(f"❌ {name}: FAIL - {str(e)}")
-                print(f"❌ {name}: FAIL - {str(e)}")
+                results.add_fail(f"❌ {name}: FAIL - {str(e)}")
         
         # Test TaskDialog
         def test_task_dialog():
             try:
-                dialog = TaskDialog(root)
+                dialog = TaskDialog(window)
                 
                 # Test that dialog was created
                 assert dialog is not None
@@ -345,7 +367,7 @@ def run_integration_tests():
         # Test TaskTable
         def test_task_table():
             try:
-                table = ModernTaskTable(root)
+                table = ModernTaskTable(window)
                 
                 # Test that table was created
                 assert table is not None
@@ -396,31 +418,31 @@ def run_integration_tests():
         test_integration("ThemeManager", test_theme_manager)
         
         # Display results
-        results_text = "\n".join(results)
-        results_label = tk.Label(test_frame, text=results_text, font=("Segoe UI", 10), justify="left")
+        results_text = "\n".join(results.lines)
+        results_label = tk.Label(test_frame, text=results_text, font=results_font, justify="left")
         results_label.pack(pady=20)
         
         # Close button
-        close_btn = tk.Button(test_frame, text="Close Tests", command=root.destroy)
+        close_btn = tk.Button(test_frame, text="Close Tests", command=window.destroy)
         close_btn.pack(pady=10)
         
         print(f"\n📊 Integration Test Results:\n{results_text}")
-        print(f"\n✅ {len([r for r in results if 'PASS' in r])} passed, ❌ {len([r for r in results if 'FAIL' in r])} failed")
+        print(f"\n{results.summary()}")
         
-        root.mainloop()
+        window.wait_window()
         
     except Exception as e:
         print(f"❌ Integration tests failed: {e}")
 
-def run_performance_tests():
-    """Run performance tests."""
+def run_performance_tests(root=None, include_ui: bool = True, include_db: bool = True):
+    """Run performance tests; UI checks need the shared root and the main thread."""
     print("\n⚡ Running Performance Tests...")
     
     try:
         from database import db_manager
         import time
         
-        results = []
+        results = SuiteResults()
         
         def test_performance(name: str, test_func):
             """Test performance and record results."""
@@ -431,73 +453,179 @@ def run_performance_tests():
                 duration = end_time - start_time
                 
                 if duration < 1.0:
-                    results.append(f"✅ {name}: PASS ({duration:.3f}s)")
-                    print(f"✅ {name}: PASS ({duration:.3f}s)")
+                    results.add_pass(f"✅ {name}: PASS ({duration:.3f}s)")
                 else:
-                    results.append(f"⚠️ {name}: SLOW ({duration:.3f}s)")
-                    print(f"⚠️ {name}: SLOW ({duration:.3f}s)")
+                    results.add_pass(f"⚠️ {name}: SLOW ({duration:.3f}s)")
             except Exception as e:
-                results.append(f"❌ {name}: FAIL - {str(e)}")
-                print(f"❌ {name}: FAIL - {str(e)}")
+                results.add_fail(f"❌ {name}: FAIL - {str(e)}")
         
         # Test database performance
         def test_database_performance():
-            # Add multiple tasks
-            for i in range(10):
-                task_data = {
+            # Add multiple tasks in one transaction
+            rows = [
+                {
                     'title': f'Performance Test Task {i}',
                     'description': f'Test description {i}',
                     'status': 'Working on it',
                     'priority': 'Medium',
                     'project': 'performance_test'
                 }
-                db_manager.add_task(task_data)
+                for i in range(10)
+            ]
+            assert db_manager.add_tasks_bulk(rows) == 10
             
             # Get tasks
             tasks = db_manager.get_tasks(project='performance_test')
             assert len(tasks) == 10
             
-            # Clean up
-            for task in tasks:
-                db_manager.delete_task(task['id'])
+            # Clean up with a single DELETE
+            assert db_manager.delete_tasks_by_project('performance_test') == 10
         
-        test_performance("Database Operations (10 tasks)", test_database_performance)
+        if include_db:
+            test_performance("Database Operations (10 tasks)", test_database_performance)
+        
+        # Test SQL-side overdue filtering
+        def test_overdue_filter_1000_rows():
+            rows = [
+                {
+                    'title': f'Overdue Filter Task {i}',
+                    'status': 'Working on it',
+                    'priority': 'Medium',
+                    # Alternate past and future due dates
+                    'due_date': '2020-01-01' if i % 2 else '2099-01-01',
+                    'project': 'performance_test'
+                }
+                for i in range(1000)
+            ]
+            db_manager.add_tasks_bulk(rows)
+            try:
+                overdue = db_manager.get_tasks(project='performance_test', limit=-1, overdue_only=True)
+                assert len(overdue) == 500
+            finally:
+                db_manager.delete_tasks_by_project('performance_test')
+        
+        if include_db:
+            test_performance("Overdue Filter (1000 rows)", test_overdue_filter_1000_rows)
         
         # Test UI component creation
         def test_ui_performance():
             import tkinter as tk
-            import ttkbootstrap as tb
             from ui.components import ModernEntry, ModernButton
             
-            root = tb.Window()
-            root.withdraw()
+            parent = tk.Toplevel(root)
+            parent.withdraw()
             
-            # Create multiple components
+            # Create multiple components, resolving entry colors once
+            style_cache = {}
             for i in range(50):
-                entry = ModernEntry(root, placeholder=f"Entry {i}")
-                button = ModernButton(root, text=f"Button {i}")
+                entry = ModernEntry(parent, placeholder=f"Entry {i}", style_cache=style_cache)
+                button = ModernButton(parent, text=f"Button {i}")
             
-            root.destroy()
+            parent.destroy()
         
-        test_performance("UI Component Creation (50 components)", test_ui_performance)
+        # Test task table population
+        def test_table_populate_1000():
+            import tkinter as tk
+            from ui.task_table import ModernTaskTable
+            
+            parent = tk.Toplevel(root)
+            parent.withdraw()
+            
+            tasks = [
+                {
+                    'id': i,
+                    'title': f'Task {i}',
+                    'status': 'Working on it',
+                    'priority': 'Medium',
+                    'due_date': '2024-01-01'
+                }
+                for i in range(1000)
+            ]
+            
+            try:
+                table = ModernTaskTable(parent)
+                table.set_tasks(tasks)
+                assert len(table.tree.get_children()) == 1000
+            finally:
+                parent.destroy()
+        
+        if include_ui:
+            test_performance("UI Component Creation (50 components)", test_ui_performance)
+            test_performance("Task Table Populate (1000 rows)", test_table_populate_1000)
         
         print(f"\n📊 Performance Test Results:")
-        for result in results:
+        for result in results.lines:
             print(result)
         
     except Exception as e:
         print(f"❌ Performance tests failed: {e}")
 
-def main():
+# Suites in run order; UI suites import tkinter/ttkbootstrap lazily inside their bodies
+TEST_SUITES = {
+    'component': run_component_tests,
+    'functionality': run_functionality_tests,
+    'integration': run_integration_tests,
+    'performance': run_performance_tests,
+}
+UI_SUITES = {'component', 'integration'}
+
+def parse_args(argv=None):
+    """Parse command line options for selecting test suites."""
+    parser = argparse.ArgumentParser(description="Run the SoulPlanner test suites.")
+    parser.add_argument('--only', choices=list(TEST_SUITES), action='append',
+                        help="Run only the given suite (may be repeated)")
+    parser.add_argument('--skip-ui', action='store_true',
+                        help="Skip suites that open Tk windows (functionality and performance only)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main test runner."""
+    args = parse_args(argv)
+    
+    # Point the database at a throwaway file before anything imports it
+    os.environ.setdefault('SOULPLANNER_TEST', '1')
+    
     print("🚀 Starting SoulPlanner Test Suite")
     print("=" * 50)
     
-    # Run all test suites
-    run_component_tests()
-    run_functionality_tests()
-    run_integration_tests()
-    run_performance_tests()
+    selected = args.only or list(TEST_SUITES)
+    if args.skip_ui:
+        selected = [name for name in selected if name not in UI_SUITES]
+    
+    # One hidden Tk root shared by every UI suite, so ttkbootstrap's theme
+    # engine is set up once per run
+    root = None
+    if not args.skip_ui and (UI_SUITES.intersection(selected) or 'performance' in selected):
+        try:
+            import ttkbootstrap as tb
+            from config import THEMES
+            root = tb.Window(themename=THEMES["light"]["name"])
+            root.withdraw()
+        except Exception as e:
+            print(f"⚠️ Could not create Tk root, UI tests will fail: {e}")
+    
+    # Run the selected test suites. Suites that never touch Tk go to worker
+    # threads so they finish while the GUI suites wait on their windows;
+    # everything using Tk stays on the main thread.
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = []
+            if 'functionality' in selected:
+                futures.append(executor.submit(run_functionality_tests))
+            if 'performance' in selected:
+                futures.append(executor.submit(run_performance_tests, include_ui=False))
+            
+            for name in selected:
+                if name in UI_SUITES:
+                    TEST_SUITES[name](root)
+            if 'performance' in selected and not args.skip_ui:
+                run_performance_tests(root, include_db=False)
+            
+            for future in futures:
+                future.result()
+    finally:
+        if root is not None:
+            root.destroy()
     
     print("\n" + "=" * 50)
     print("🎉 Test Suite Complete!")
@@ -6,338 +6,341 @@ This version avoids Tkinter window lifecycle issues by using a single main windo
 import sys
 import os
 import time
-import threading
-from typing import List, Dict, Any
+import io
+import itertools
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import tkinter as tk
+from tkinter import ttk
+
+# Use a throwaway database file; must be set before database is imported
+os.environ.setdefault('SOULPLANNER_TEST', '1')
+
+from config import APP_NAME, APP_VERSION, THEMES, FONTS
+from database import db_manager
+from models import TaskStatus, TaskPriority
+from utils import validate_task_data, format_date, is_overdue
+from ui.components import ModernEntry, ModernButton, SearchEntry, StatusPill, PriorityBadge
+from ui.theme_manager import ThemeManager
+from _tk_root import get_root
+
+# Every result line goes through one logger: echoed to stdout here, and
+# captured per suite by _suite_logger for the summaries
+logger = logging.getLogger("soulplanner.tests")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(logging.StreamHandler(sys.stdout))
+
+class Runner:
+    """Runs the tests of one suite, logging and counting their outcomes."""
+    
+    def __init__(self, suite: str, timed: bool = False):
+        self.results = []  # (name, outcome) pairs
+        self.counts = Counter()
+        self.timed = timed
+        # Child logger per suite: lines reach stdout through the parent and
+        # are captured in this suite's own buffer
+        self.log = logging.getLogger(f"soulplanner.tests.{suite}")
+        self.buffer = io.StringIO()
+        self.log.handlers[:] = [logging.StreamHandler(self.buffer)]
+    
+    def run(self, name: str, test_func):
+        """Run a test and record its result; timed suites flag runs over 1s as slow."""
+        try:
+            start_time = time.time()
+            test_func()
+            duration = time.time() - start_time
+        except Exception as e:
+            self._record(name, "fail", "❌ %s: FAIL - %s", name, e)
+            return
+        if not self.timed:
+            self._record(name, "pass", "✅ %s: PASS", name)
+        elif duration < 1.0:
+            self._record(name, "pass", "✅ %s: PASS (%.3fs)", name, duration)
+        else:
+            self._record(name, "slow", "⚠️ %s: SLOW (%.3fs)", name, duration)
+    
+    def _record(self, name: str, outcome: str, msg: str, *args):
+        self.results.append((name, outcome))
+        self.counts[outcome] += 1
+        self.log.info(msg, *args)
+    
+    def summary(self) -> str:
+        """One-line pass/fail (and slow, for timed suites) count."""
+        parts = [f"✅ {self.counts['pass']} passed"]
+        if self.timed:
+            parts.append(f"⚠️ {self.counts['slow']} slow")
+        parts.append(f"❌ {self.counts['fail']} failed")
+        return ", ".join(parts)
+
 def run_simple_tests():
     """Run simple tests that don't require complex UI interactions."""
     print("🧪 Running Simple Tests...")
     
-    try:
-        from database import db_manager
-        from utils import validate_task_data, format_date, is_overdue
-        from models import TaskStatus, TaskPriority
-        from config import APP_NAME, APP_VERSION, THEMES, FONTS
-        
-        results = []
-        
-        def test_function(name: str, test_func):
-            """Test a function and record results."""
-            try:
-                test_func()
-                results.append(f"✅ {name}: PASS")
-                print(f"✅ {name}: PASS")
-            except Exception as e:
-                results.append(f"❌ {name}: FAIL - {str(e)}")
-                print(f"❌ {name}: FAIL - {str(e)}")
-        
-        # Test database operations
-        def test_database_operations():
-            # Test adding task
-            task_data = {
-                'title': 'Test Task',
-                'description': 'Test Description',
-                'status': 'Working on it',
-                'priority': 'Medium',
-                'project': 'test'
-            }
-            
-            task_id = db_manager.add_task(task_data)
-            assert task_id is not None
-            assert task_id > 0
-            
-            # Test getting tasks
-            tasks = db_manager.get_tasks(project='test')
-            assert isinstance(tasks, list)
-            assert len(tasks) > 0
-            
-            # Test updating task
-            update_data = {'title': 'Updated Title'}
-            success = db_manager.update_task(task_id, **update_data)
-            assert success is True
-            
-            # Test deleting task
-            success = db_manager.delete_task(task_id)
-            assert success is True
-        
-        test_function("Database Operations", test_database_operations)
-        
-        # Test validation
-        def test_validation():
-            # Test valid data
-            valid_data = {
-                'title': 'Test Task',
-                'status': 'Working on it',
-                'priority': 'Medium'
-            }
-            is_valid, error = validate_task_data(valid_data)
-            assert is_valid is True
-            assert error == ""
-            
-            # Test invalid data
-            invalid_data = {
-                'status': 'Working on it',
-                'priority': 'Medium'
-            }
-            is_valid, error = validate_task_data(invalid_data)
-            assert is_valid is False
-            assert "title" in error.lower()
-        
-        test_function("Data Validation", test_validation)
-        
-        # Test utility functions
-        def test_utility_functions():
-            # Test date formatting
-            formatted = format_date("2024-01-01")
-            assert formatted is not None
-            
-            # Test overdue checking
-            overdue = is_overdue("2020-01-01")
-            assert overdue is True
-            
-            future = is_overdue("2030-01-01")
-            assert future is False
-        
-        test_function("Utility Functions", test_utility_functions)
-        
-        # Test configuration
-        def test_configuration():
-            assert APP_NAME is not None
-            assert APP_VERSION is not None
-            assert THEMES is not None
-            assert FONTS is not None
-            assert "light" in THEMES
-            assert "dark" in THEMES
-        
-        test_function("Configuration", test_configuration)
-        
-        print(f"\n📊 Simple Test Results:")
-        for result in results:
-            print(result)
-        print(f"\n✅ {len([r for r in results if 'PASS' in r])} passed, ❌ {len([r for r in results if 'FAIL' in r])} failed")
-        
-        return results
-        
-    except Exception as e:
-        print(f"❌ Simple tests failed: {e}")
-        return []
+    runner = Runner("simple")
+    
+    # Test database operations
+    def test_database_operations():
+        # Test adding task
+        task_data = {
+            'title': 'Test Task',
+            'description': 'Test Description',
+            'status': 'Working on it',
+            'priority': 'Medium',
+            'project': 'test'
+        }
+        
+        task_id = db_manager.add_task(task_data)
+        assert task_id is not None
+        assert task_id > 0
+        
+        # Test getting tasks
+        tasks = db_manager.get_tasks(project='test')
+        assert isinstance(tasks, list)
+        assert len(tasks) > 0
+        
+        # Test updating task
+        update_data = {'title': 'Updated Title'}
+        success = db_manager.update_task(task_id, **update_data)
+        assert success is True
+        
+        # Test deleting task
+        success = db_manager.delete_task(task_id)
+        assert success is True
+    
+    runner.run("Database Operations", test_database_operations)
+    
+    # Test validation
+    def test_validation():
+        # Test valid data
+        valid_data = {
+            'title': 'Test Task',
+            'status': 'Working on it',
+            'priority': 'Medium'
+        }
+        is_valid, error = validate_task_data(valid_data)
+        assert is_valid is True
+        assert error == ""
+        
+        # Test invalid data
+        invalid_data = {
+            'status': 'Working on it',
+            'priority': 'Medium'
+        }
+        is_valid, error = validate_task_data(invalid_data)
+        assert is_valid is False
+        assert "title" in error.lower()
+    
+    runner.run("Data Validation", test_validation)
+    
+    # Test utility functions
+    def test_utility_functions():
+        # Test date formatting
+        formatted = format_date("2024-01-01")
+        assert formatted is not None
+        
+        # Test overdue checking
+        overdue = is_overdue("2020-01-01")
+        assert overdue is True
+        
+        future = is_overdue("2030-01-01")
+        assert future is False
+    
+    runner.run("Utility Functions", test_utility_functions)
+    
+    # Test configuration
+    def test_configuration():
+        assert APP_NAME is not None
+        assert APP_VERSION is not None
+        assert THEMES is not None
+        assert FONTS is not None
+        assert "light" in THEMES
+        assert "dark" in THEMES
+    
+    runner.run("Configuration", test_configuration)
+    
+    print(f"\n📊 Simple Test Results: {runner.summary()}")
+    
+    return runner.results
 
 def run_ui_tests():
     """Run UI tests with a single main window to avoid lifecycle issues."""
     print("\n🎨 Running UI Tests...")
     
-    try:
-        import tkinter as tk
-        from tkinter import ttk
-        import ttkbootstrap as tb
-        from ui.components import ModernEntry, ModernButton, SearchEntry, StatusPill, PriorityBadge
-        from ui.theme_manager import ThemeManager
-        from config import THEMES, FONTS
-        
-        # Create single test window
-        root = tb.Window(themename=THEMES["light"]["name"])
-        root.title("UI Test Suite")
-        root.geometry("900x700")
-        
-        # Create notebook for different test categories
-        notebook = ttk.Notebook(root)
-        notebook.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        results = []
-        
-        def test_ui_component(name: str, test_func):
-            """Test a UI component and record results."""
-            try:
-                test_func()
-                results.append(f"✅ {name}: PASS")
-                print(f"✅ {name}: PASS")
-            except Exception as e:
-                results.append(f"❌ {name}: FAIL - {str(e)}")
-                print(f"❌ {name}: FAIL - {str(e)}")
-        
-        # Component Tests Tab
-        component_frame = ttk.Frame(notebook)
-        notebook.add(component_frame, text="Components")
-        
-        # Test ModernEntry
-        def test_modern_entry():
-            entry = ModernEntry(component_frame, placeholder="Test placeholder")
-            entry.pack(pady=5, padx=10, fill="x")
-            
-            # Test initial state
-            assert entry.get() == "Test placeholder"
-            
-            # Test get_value method
-            entry.delete(0, tk.END)
-            entry.insert(0, "test value")
-            assert entry.get_value() == "test value"
-        
-        test_ui_component("ModernEntry", test_modern_entry)
-        
-        # Test ModernButton
-        def test_modern_button():
-            button = ModernButton(component_frame, text="Test Button", primary=True)
-            button.pack(pady=5, padx=10)
-            
-            # Test initial state
-            assert button.cget("text") == "Test Button"
-            
-            # Test loading state
-            button.set_loading(True)
-            assert button.cget("state") == "disabled"
-            
-            button.set_loading(False)
-            assert button.cget("state") == "normal"
-        
-        test_ui_component("ModernButton", test_modern_button)
-        
-        # Test SearchEntry
-        def test_search_entry():
-            search_calls = []
-            
-            def on_search(term):
-                search_calls.append(term)
-            
-            entry = SearchEntry(component_frame, on_search)
-            entry.pack(pady=5, padx=10, fill="x")
-            
-            # Test initial state
-            assert entry.get() == "Search tasks..."
-        
-        test_ui_component("SearchEntry", test_search_entry)
-        
-        # Test StatusPill
-        def test_status_pill():
-            pill = StatusPill(component_frame, "Working on it")
-            pill.pack(pady=5, padx=10)
-            
-            # Test that the widget was created successfully
-            assert pill.cget("text") == "Working on it"
-        
-        test_ui_component("StatusPill", test_status_pill)
-        
-        # Test PriorityBadge
-        def test_priority_badge():
-            badge = PriorityBadge(component_frame, "High")
-            badge.pack(pady=5, padx=10)
-            
-            # Test that the widget was created successfully
-            assert badge.cget("text") == "High"
-        
-        test_ui_component("PriorityBadge", test_priority_badge)
+    # Reuse the shared hidden root as the single test window
+    root = get_root()
+    root.title("UI Test Suite")
+    root.geometry("900x700")
+    
+    # Create notebook for different test categories
+    notebook = ttk.Notebook(root)
+    notebook.pack(fill="both", expand=True, padx=10, pady=10)
+    
+    runner = Runner("ui")
+    
+    # Component Tests Tab
+    component_frame = ttk.Frame(notebook)
+    notebook.add(component_frame, text="Components")
+    # One grid column for every tested widget; rows are handed out in order
+    component_frame.grid_columnconfigure(0, weight=1)
+    component_rows = itertools.count()
+    
+    # Test ModernEntry
+    def test_modern_entry():
+        entry = ModernEntry(component_frame, placeholder="Test placeholder")
+        entry.grid(row=next(component_rows), column=0, sticky="ew", padx=10, pady=5)
+        
+        # Test initial state
+        assert entry.get() == "Test placeholder"
+        
+        # Test get_value method
+        entry.delete(0, tk.END)
+        entry.insert(0, "test value")
+        assert entry.get_value() == "test value"
+    
+    runner.run("ModernEntry", test_modern_entry)
+    
+    # Test ModernButton
+    def test_modern_button():
+        button = ModernButton(component_frame, text="Test Button", primary=True)
+        button.grid(row=next(component_rows), column=0, padx=10, pady=5)
         
-        # Theme Tests Tab
-        theme_frame = ttk.Frame(notebook)
-        notebook.add(theme_frame, text="Theme")
+        # Test initial state
+        assert button.cget("text") == "Test Button"
         
-        def test_theme_manager():
-            theme_manager = ThemeManager(root)
-            
-            # Test that manager was created
-            assert theme_manager is not None
-            
-            # Test theme switching
-            current_theme = theme_manager.get_current_theme_config()
-            assert current_theme is not None
-            
-            # Create theme toggle button
-            theme_btn = theme_manager.create_theme_button(theme_frame)
-            theme_btn.pack(pady=20)
+        # Test loading state
+        button.set_loading(True)
+        assert button.cget("state") == "disabled"
         
-        test_ui_component("ThemeManager", test_theme_manager)
+        button.set_loading(False)
+        assert button.cget("state") == "normal"
+    
+    runner.run("ModernButton", test_modern_button)
+    
+    # Test SearchEntry
+    def test_search_entry():
+        search_calls = []
         
-        # Results Tab
-        results_frame = ttk.Frame(notebook)
-        notebook.add(results_frame, text="Results")
+        def on_search(term):
+            search_calls.append(term)
         
-        # Display results
-        results_text = "\n".join(results)
-        results_label = tk.Label(results_frame, text=results_text, font=FONTS["primary"], justify="left")
-        results_label.pack(pady=20, padx=20)
+        entry = SearchEntry(component_frame, on_search)
+        entry.grid(row=next(component_rows), column=0, sticky="ew", padx=10, pady=5)
         
-        # Summary
-        summary_text = f"✅ {len([r for r in results if 'PASS' in r])} passed, ❌ {len([r for r in results if 'FAIL' in r])} failed"
-        summary_label = tk.Label(results_frame, text=summary_text, font=FONTS["primary_bold"])
-        summary_label.pack(pady=10)
+        # Test initial state
+        assert entry.get() == "Search tasks..."
+    
+    runner.run("SearchEntry", test_search_entry)
+    
+    # Test StatusPill
+    def test_status_pill():
+        pill = StatusPill(component_frame, "Working on it")
+        pill.grid(row=next(component_rows), column=0, padx=10, pady=5)
         
-        # Close button
-        close_btn = ModernButton(results_frame, text="Close Tests", command=root.destroy)
-        close_btn.pack(pady=20)
+        # Test that the widget was created successfully
+        assert pill.cget("text") == "Working on it"
+    
+    runner.run("StatusPill", test_status_pill)
+    
+    # Test PriorityBadge
+    def test_priority_badge():
+        badge = PriorityBadge(component_frame, "High")
+        badge.grid(row=next(component_rows), column=0, padx=10, pady=5)
         
-        print(f"\n📊 UI Test Results:\n{results_text}")
-        print(f"\n{summary_text}")
+        # Test that the widget was created successfully
+        assert badge.cget("text") == "High"
+    
+    runner.run("PriorityBadge", test_priority_badge)
+    
+    # Theme Tests Tab
+    theme_frame = ttk.Frame(notebook)
+    notebook.add(theme_frame, text="Theme")
+    
+    def test_theme_manager():
+        theme_manager = ThemeManager(root)
         
-        root.mainloop()
+        # Test that manager was created
+        assert theme_manager is not None
         
-        return results
+        # Test theme switching
+        current_theme = theme_manager.get_current_theme_config()
+        assert current_theme is not None
         
-    except Exception as e:
-        print(f"❌ UI tests failed: {e}")
-        return []
+        # Create theme toggle button
+        theme_btn = theme_manager.create_theme_button(theme_frame)
+        theme_btn.pack(pady=20)
+    
+    runner.run("ThemeManager", test_theme_manager)
+    
+    # Results Tab
+    results_frame = ttk.Frame(notebook)
+    notebook.add(results_frame, text="Results")
+    
+    # Display results
+    results_text = runner.buffer.getvalue().rstrip("\n")
+    results_label = tk.Label(results_frame, text=results_text, font=FONTS["primary"], justify="left")
+    results_label.pack(pady=20, padx=20)
+    
+    # Summary
+    summary_text = runner.summary()
+    summary_label = tk.Label(results_frame, text=summary_text, font=FONTS["primary_bold"])
+    summary_label.pack(pady=10)
+    
+    # Close button
+    def close():
+        # Hide the shared root again instead of destroying it
+        notebook.destroy()
+        root.withdraw()
+        root.quit()
+    
+    close_btn = ModernButton(results_frame, text="Close Tests", command=close)
+    close_btn.pack(pady=20)
+    
+    print(f"\n📊 UI Test Results: {summary_text}")
+    
+    root.deiconify()
+    root.mainloop()
+    
+    return runner.results
 
 def run_performance_tests():
     """Run performance tests."""
     print("\n⚡ Running Performance Tests...")
     
-    try:
-        from database import db_manager
-        import time
-        
-        results = []
-        
-        def test_performance(name: str, test_func):
-            """Test performance and record results."""
-            try:
-                start_time = time.time()
-                test_func()
-                end_time = time.time()
-                duration = end_time - start_time
-                
-                if duration < 1.0:
-                    results.append(f"✅ {name}: PASS ({duration:.3f}s)")
-                    print(f"✅ {name}: PASS ({duration:.3f}s)")
-                else:
-                    results.append(f"⚠️ {name}: SLOW ({duration:.3f}s)")
-                    print(f"⚠️ {name}: SLOW ({duration:.3f}s)")
-            except Exception as e:
-                results.append(f"❌ {name}: FAIL - {str(e)}")
-                print(f"❌ {name}: FAIL - {str(e)}")
-        
-        # Test database performance
-        def test_database_performance():
-            # Add multiple tasks
-            for i in range(10):
-                task_data = {
-                    'title': f'Performance Test Task {i}',
-                    'description': f'Test description {i}',
-                    'status': 'Working on it',
-                    'priority': 'Medium',
-                    'project': 'performance_test'
-                }
-                db_manager.add_task(task_data)
-            
-            # Get tasks
-            tasks = db_manager.get_tasks(project='performance_test')
-            assert len(tasks) == 10
-            
-            # Clean up
-            for task in tasks:
-                db_manager.delete_task(task['id'])
-        
-        test_performance("Database Operations (10 tasks)", test_database_performance)
-        
-        print(f"\n📊 Performance Test Results:")
-        for result in results:
-            print(result)
+    runner = Runner("performance", timed=True)
+    
+    # Test database performance
+    def test_database_performance():
+        # Add multiple tasks in one transaction
+        rows = [
+            {
+                'title': f'Performance Test Task {i}',
+                'description': f'Test description {i}',
+                'status': 'Working on it',
+                'priority': 'Medium',
+                'project': 'performance_test'
+            }
+            for i in range(10)
+        ]
+        assert db_manager.add_tasks_bulk(rows) == 10
         
-        return results
+        # Get tasks
+        tasks = db_manager.get_tasks(project='performance_test')
+        assert len(tasks) == 10
         
-    except Exception as e:
-        print(f"❌ Performance tests failed: {e}")
-        return []
+        # Clean up with a single DELETE
+        assert db_manager.delete_tasks_by_project('performance_test') == 10
+    
+    runner.run("Database Operations (10 tasks)", test_database_performance)
+    
+    print(f"\n📊 Performance Test Results: {runner.summary()}")
+    
+    return runner.results
 
 def main():
     """Main test runner."""
@@ -346,25 +349,25 @@ def main():
     
     all_results = []
     
-    # Run simple tests (no UI)
-    simple_results = run_simple_tests()
-    all_results.extend(simple_results)
+    # The simple and performance suites only touch the database, so they run
+    # on a worker thread while the UI suite holds the main thread for Tk
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        db_results = executor.submit(lambda: (run_simple_tests(), run_performance_tests()))
+        ui_results = run_ui_tests()
+        simple_results, perf_results = db_results.result()
     
-    # Run UI tests
-    ui_results = run_ui_tests()
+    all_results.extend(simple_results)
     all_results.extend(ui_results)
-    
-    # Run performance tests
-    perf_results = run_performance_tests()
     all_results.extend(perf_results)
     
     print("\n" + "=" * 50)
     print("🎉 Test Suite Complete!")
     
     # Summary
-    passed = len([r for r in all_results if 'PASS' in r])
-    failed = len([r for r in all_results if 'FAIL' in r])
-    slow = len([r for r in all_results if 'SLOW' in r])
+    totals = Counter(outcome for _, outcome in all_results)
+    passed = totals["pass"]
+    failed = totals["fail"]
+    slow = totals["slow"]
     
     print(f"\n📊 Final Summary:")
     print(f"✅ Passed: {passed}")
@@ -6,7 +6,6 @@ import tkinter as tk
 from tkinter import ttk
 import ttkbootstrap as tb
 import threading
-import time
 from typing import Dict, Any, Optional
 import sys
 import os
@@ -14,14 +13,50 @@ import os
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Use a throwaway database file; must be set before database is imported
+os.environ.setdefault('SOULPLANNER_TEST', '1')
+
 from config import APP_NAME, APP_VERSION, THEMES, FONTS
 from database import db_manager
 from models import Task, TaskStatus, TaskPriority
-from utils import validate_task_data, format_date, is_overdue
+from utils import validate_task_data, format_date, is_overdue, is_overdue_batch
 from ui.components import ModernEntry, ModernButton, SearchEntry, StatusPill, PriorityBadge
 from ui.task_dialog import TaskDialog
 from ui.task_table import ModernTaskTable
 from ui.theme_manager import ThemeManager
+from _tk_root import get_root
+
+try:
+    import pytest
+    # Tests that drive a full dialog workflow; run them outside the parallel pass
+    serial = pytest.mark.serial
+except ImportError:
+    pytest = None
+    serial = lambda test: test
+
+class FakeScheduler:
+    """Stand-in for Tk's after/after_cancel that runs callbacks when advanced."""
+    
+    def __init__(self):
+        self.now = 0
+        self.pending = {}
+        self._next_id = 0
+    
+    def after(self, delay_ms, callback):
+        self._next_id += 1
+        self.pending[self._next_id] = (self.now + delay_ms, callback)
+        return self._next_id
+    
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+    
+    def advance(self, ms):
+        """Move the clock forward and run every callback that has come due."""
+        self.now += ms
+        due = sorted((when, after_id) for after_id, (when, _) in self.pending.items() if when <= self.now)
+        for _, after_id in due:
+            _, callback = self.pending.pop(after_id)
+            callback()
 
 class TestBase(unittest.TestCase):
     """Base class for all tests with common setup."""
@@ -29,22 +64,20 @@ class TestBase(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment once for all tests."""
-        cls.root = tb.Window(themename=THEMES["light"]["name"])
-        cls.root.withdraw()  # Hide window during tests
+        cls.root = get_root()  # Shared hidden root
         
     @classmethod
     def tearDownClass(cls):
         """Clean up test environment."""
+        # The root is shared, so only remove what this class created
         if hasattr(cls, 'root'):
-            cls.root.destroy()
+            for child in cls.root.winfo_children():
+                child.destroy()
     
     def setUp(self):
         """Set up before each test."""
-        # Clear database for each test
-        try:
-            db_manager._init_database()
-        except:
-            pass
+        # The schema is created once when database is imported; just empty the tables
+        self.assertTrue(db_manager.truncate_all())
     
     def tearDown(self):
         """Clean up after each test."""
@@ -138,6 +171,15 @@ class TestDatabaseOperations(TestBase):
 class TestUIComponents(TestBase):
     """Test individual UI components."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the widgets that tests only inspect once for the whole class."""
+        super().setUpClass()
+        cls.widgets = {
+            'status_pill': StatusPill(cls.root, "Working on it"),
+            'priority_badge': PriorityBadge(cls.root, "High"),
+        }
+    
     def test_modern_entry_placeholder(self):
         """Test ModernEntry placeholder functionality."""
         entry = ModernEntry(self.root, placeholder="Test placeholder")
@@ -172,29 +214,71 @@ class TestUIComponents(TestBase):
         def on_search(term):
             search_calls.append(term)
         
-        entry = SearchEntry(self.root, on_search)
+        scheduler = FakeScheduler()
+        entry = SearchEntry(self.root, on_search, scheduler=scheduler)
         
         # Type quickly
         entry.delete(0, tk.END)
         entry.insert(0, "test")
         entry.event_generate("<KeyRelease>")
+        entry.event_generate("<KeyRelease>")
         
-        # Wait for debounce
-        time.sleep(0.4)
+        # Advance past the debounce delay without sleeping
+        scheduler.advance(400)
         
         # Should have called search once
         self.assertEqual(len(search_calls), 1)
         self.assertEqual(search_calls[0], "test")
     
+    def test_search_entry_return_and_repeat(self):
+        """Test SearchEntry searches at once on Enter and skips repeated terms."""
+        search_calls = []
+        scheduler = FakeScheduler()
+        entry = SearchEntry(self.root, search_calls.append, scheduler=scheduler)
+        
+        entry.delete(0, tk.END)
+        entry.insert(0, "test")
+        entry.event_generate("<KeyRelease>")
+        entry.event_generate("<Return>")
+        self.assertEqual(search_calls, ["test"])
+        self.assertEqual(scheduler.pending, {})
+        
+        # Same term again: the debounce fires but nothing is re-run
+        entry.event_generate("<KeyRelease>")
+        scheduler.advance(400)
+        self.assertEqual(search_calls, ["test"])
+    
+    def test_search_entry_reset_then_same_term(self):
+        """Test the same term is searched again after reset, and a pending search is dropped."""
+        search_calls = []
+        scheduler = FakeScheduler()
+        entry = SearchEntry(self.root, search_calls.append, scheduler=scheduler)
+        
+        entry.delete(0, tk.END)
+        entry.insert(0, "foo")
+        entry.event_generate("<Return>")
+        
+        # Leave a debounce pending, then clear as the task table does
+        entry.event_generate("<KeyRelease>")
+        entry.reset()
+        self.assertEqual(scheduler.pending, {})
+        self.assertEqual(entry.get_value(), "")
+        
+        entry.delete(0, tk.END)
+        entry.insert(0, "foo")
+        entry.event_generate("<KeyRelease>")
+        scheduler.advance(400)
+        self.assertEqual(search_calls, ["foo", "foo"])
+    
     def test_status_pill_colors(self):
         """Test StatusPill color assignment."""
-        status_pill = StatusPill(self.root, "Working on it")
+        status_pill = self.widgets['status_pill']
         # Test that the widget was created successfully
         self.assertIsNotNone(status_pill)
     
     def test_priority_badge_colors(self):
         """Test PriorityBadge color assignment."""
-        priority_badge = PriorityBadge(self.root, "High")
+        priority_badge = self.widgets['priority_badge']
         # Test that the widget was created successfully
         self.assertIsNotNone(priority_badge)
 
@@ -358,10 +442,16 @@ class TestUtils(TestBase):
         # Test None date
         none_date = is_overdue(None)
         self.assertFalse(none_date)
+    
+    def test_is_overdue_batch(self):
+        """Test batch overdue checking matches the scalar version."""
+        dates = ["2020-01-01", "2030-01-01", None, "", "invalid-date"]
+        self.assertEqual(is_overdue_batch(dates), [is_overdue(d) for d in dates])
 
 class TestIntegration(TestBase):
     """Integration tests for the complete application."""
     
+    @serial
     def test_complete_task_workflow(self):
         """Test complete task creation and management workflow."""
         # Create task dialog
@@ -403,8 +493,8 @@ def run_ui_tests():
     """Run UI tests with visual feedback."""
     print("Starting UI Tests...")
     
-    # Create test window
-    root = tb.Window(themename=THEMES["light"]["name"])
+    # Reuse the shared root as the test window
+    root = get_root()
     root.title("UI Test Suite")
     root.geometry("800x600")
     
@@ -469,17 +559,38 @@ def run_ui_tests():
     results_label = ttk.Label(test_frame, text="\n".join(results), font=FONTS["primary"])
     results_label.pack(pady=20)
     
-    # Close button
-    close_btn = ModernButton(test_frame, text="Close Tests", command=root.destroy)
+    # Close button hides the shared root again instead of destroying it
+    def close():
+        test_frame.destroy()
+        root.withdraw()
+        root.quit()
+    
+    close_btn = ModernButton(test_frame, text="Close Tests", command=close)
     close_btn.pack(pady=10)
     
     print("UI Tests completed. Check the window for results.")
+    root.deiconify()
     root.mainloop()
 
+def run_unit_tests():
+    """Run the unit tests, in parallel across CPU cores when pytest-xdist is installed."""
+    try:
+        import xdist  # noqa: F401
+    except ImportError:
+        xdist = None
+    
+    if pytest is None or xdist is None:
+        unittest.main(verbosity=2, exit=False)
+        return
+    
+    # loadscope keeps each test class (and its Tk root) on a single worker
+    pytest.main([__file__, "-v", "-n", "auto", "--dist", "loadscope", "-m", "not serial"])
+    pytest.main([__file__, "-v", "-m", "serial"])
+
 if __name__ == "__main__":
     # Run unit tests
     print("Running Unit Tests...")
-    unittest.main(verbosity=2, exit=False)
+    run_unit_tests()
     
     # Run UI tests
     print("\n" + "="*50)
@@ -2,9 +2,9 @@ import tkinter as tk
 from tkinter import ttk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
-import time
 import calendar
 from datetime import datetime
+from functools import lru_cache
 
 # Standard font stack: Segoe UI, Arial, sans-serif
 MODERN_FONT = ("Segoe UI", 11)
@@ -20,6 +20,32 @@ CARD_BG = "#ffffff"
 SHADOW = "#e0e4ea"
 VIBRANT_BLUE = "#2563eb"
 
+# DatePicker calendar grid: pixel size of one day cell, header row first
+DAY_CELL = 30
+DAY_NAMES = ("Mo", "Tu", "We", "Th", "Fr", "Sa", "Su")
+_MONTH_NAMES = tuple(calendar.month_name)
+
+# Modal form rows: (task_data key, label, placeholder, or the choices for a combobox)
+FORM_FIELDS = (
+    ("task", "Task", "Task name"),
+    ("owner", "Owner", "Owner"),
+    ("status", "Status", ("Working on it", "Done", "Stuck", "Not Started")),
+    ("due", "Due date", "YYYY-MM-DD"),
+    ("notes", "Notes", "Notes"),
+)
+
+@lru_cache(maxsize=256)
+def _month_calendar(year, month):
+    # Tuples so the cached weeks can't be mutated by a caller
+    return tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+
+# Shared by every combobox instead of per-widget closures
+def _combo_focus_in(event):
+    event.widget.configure(style="info.TCombobox")
+
+def _combo_focus_out(event):
+    event.widget.configure(style="TCombobox")
+
 class ModernEntry(tb.Entry):
     def __init__(self, parent, textvariable=None, placeholder="", **kwargs):
         entry_kwargs = kwargs.copy()
@@ -32,16 +58,23 @@ class ModernEntry(tb.Entry):
         if placeholder and (not textvariable or not textvariable.get()):
             self.insert(0, placeholder)
             self['foreground'] = PLACEHOLDER_COLOR
-        self.bind('<FocusIn>', self._clear_placeholder)
-        self.bind('<FocusOut>', self._add_placeholder)
-    def _clear_placeholder(self, event):
-        if self.get() == self.placeholder:
-            self.delete(0, tk.END)
-            self['foreground'] = LABEL_COLOR
-    def _add_placeholder(self, event):
-        if not self.get():
-            self.insert(0, self.placeholder)
-            self['foreground'] = PLACEHOLDER_COLOR
+        # Placeholder handling is bound once per interpreter on a shared tag
+        if '<FocusIn>' not in self.bind_class('ModernEntry'):
+            self.bind_class('ModernEntry', '<FocusIn>', ModernEntry._clear_placeholder)
+            self.bind_class('ModernEntry', '<FocusOut>', ModernEntry._add_placeholder)
+        self.bindtags(('ModernEntry',) + self.bindtags())
+    @staticmethod
+    def _clear_placeholder(event):
+        entry = event.widget
+        if entry.get() == entry.placeholder:
+            entry.delete(0, tk.END)
+            entry['foreground'] = LABEL_COLOR
+    @staticmethod
+    def _add_placeholder(event):
+        entry = event.widget
+        if not entry.get():
+            entry.insert(0, entry.placeholder)
+            entry['foreground'] = PLACEHOLDER_COLOR
 
 class ModernButton(tb.Button):
     def __init__(self, parent, text, primary=False, command=None, **kwargs):
@@ -61,29 +94,36 @@ class GlassModal(tb.Toplevel):
         self.resizable(True, True)
         self.configure(bg=BG_GRADIENT)
         self.result = None
+        self._fade_job = None
+        self._layout_job = None
+        self._date_picker = None
         if task_data is None:
             task_data = {}
+        task_data.setdefault('task', '')
+        task_data.setdefault('owner', '')
+        task_data.setdefault('status', 'Working on it')
+        task_data.setdefault('notes', '')
         # Set today's date as default if not provided
         if not task_data.get('due'):
             task_data['due'] = datetime.now().strftime("%Y-%m-%d")
-        self.task_data = task_data or {
-            'task': '',
-            'owner': '',
-            'status': 'Working on it',
-            'due': '',
-            'notes': '',
-        }
+        self.task_data = task_data
         self.attributes("-alpha", 0.0)
         self.create_styles()
         self.create_widgets()
-        self.center_modal()
-        self.after(0, self.fade_in)
+        self._layout_job = self.after_idle(self._post_layout)
         self.grab_set()
         self.wait_window(self)
 
     def create_styles(self):
         style = ttk.Style()
-        style.theme_use("flatly")
+        # The app window normally selects flatly already; switching reloads the theme
+        if style.theme_use() != "flatly":
+            style.theme_use("flatly")
+        # ttk styles belong to the root's interpreter, so the guard lives on
+        # the root and a recreated root configures them again
+        root = self._root()
+        if getattr(root, "_modern_styles_built", False):
+            return
         style.configure(
             "Modern.TEntry",
             font=MODERN_FONT,
@@ -178,17 +218,43 @@ class GlassModal(tb.Toplevel):
             background=[('active', '#f7fafd'), ('pressed', '#f7fafd')],
             relief=[('pressed', 'sunken'), ('!pressed', 'flat')],
         )
+        root._modern_styles_built = True
 
     def fade_in(self):
-        for i in range(0, 21):
-            self.attributes("-alpha", i / 20)
-            self.update()
-            time.sleep(0.01)
+        # Step the alpha from the event loop instead of sleeping in it
+        if self._fade_job is not None:
+            self.after_cancel(self._fade_job)
+        self._fade_step(0)
+
+    def _fade_step(self, i):
+        self.attributes("-alpha", i / 20)
+        if i < 20:
+            self._fade_job = self.after(16, self._fade_step, i + 1)
+        else:
+            self._fade_job = None
+
+    def destroy(self):
+        # Save/Cancel can close the modal mid-fade; drop pending callbacks
+        # so they don't touch the dead Toplevel
+        for job in (self._layout_job, self._fade_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._layout_job = self._fade_job = None
+        super().destroy()
+
+    def _post_layout(self):
+        # Runs once Tk has laid the widgets out, so geometry is read only once
+        self._layout_job = None
+        self.center_modal()
+        self.fade_in()
 
     def center_modal(self):
-        self.update_idletasks()
         w = self.winfo_width()
         h = self.winfo_height()
+        if w <= 1 or h <= 1:
+            # Not realized yet; fall back to the requested size
+            w = self.winfo_reqwidth()
+            h = self.winfo_reqheight()
         ws = self.winfo_screenwidth()
         hs = self.winfo_screenheight()
         x = (ws // 2) - (w // 2)
@@ -196,99 +262,57 @@ class GlassModal(tb.Toplevel):
         self.geometry(f"{w}x{h}+{x}+{y}")
 
     def _show_date_picker(self, entry):
-        # Only open if not already open
-        if hasattr(self, '_date_picker') and self._date_picker and self._date_picker.winfo_exists():
-            return
-        self._date_picker = DatePicker(self, entry, font=MODERN_FONT)
+        # Build the picker once; later opens reuse the withdrawn window
+        picker = self._date_picker
+        if picker is None or not picker.winfo_exists():
+            self._date_picker = DatePicker(self, entry, font=MODERN_FONT)
+        elif picker.state() == "withdrawn":
+            picker.open(entry)
 
     def create_widgets(self):
-        card = tk.Frame(self, bg=CARD_BG, bd=0, highlightthickness=0)
+        # The shadow is drawn as the card's highlight border, not a separate frame
+        card = tk.Frame(self, bg=CARD_BG, bd=0, highlightbackground=SHADOW, highlightcolor=SHADOW, highlightthickness=2)
         card.pack(fill="both", expand=True, padx=16, pady=16)
+        card.columnconfigure(0, weight=1)
         card.grid_propagate(True)
-        card.pack_propagate(True)
-        card.update_idletasks()
-        shadow = tk.Frame(self, bg=SHADOW, bd=0, highlightthickness=0)
-        shadow.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.94, relheight=0.94)
-        shadow.lower(card)
-        for i in range(1):
-            card.columnconfigure(i, weight=1)
-        row = 0
-        # Task
-        ttk.Label(card, text="Task", font=LABEL_FONT, foreground=LABEL_COLOR, background=CARD_BG).grid(row=row, column=0, sticky="w", padx=(24, 8), pady=(18, 0))
-        row += 1
-        self.task_var = tk.StringVar(value=self.task_data['task'])
-        task_entry = ModernEntry(card, textvariable=self.task_var, placeholder="Task name", width=15)
-        task_entry.grid(row=row, column=0, sticky="ew", padx=(20, 20), pady=(8, 10))
-        card.grid_columnconfigure(0, weight=1)
-        row += 1
-        # Owner
-        ttk.Label(card, text="Owner", font=LABEL_FONT, foreground=LABEL_COLOR, background=CARD_BG).grid(row=row, column=0, sticky="w", padx=(24, 8), pady=(0, 0))
-        row += 1
-        self.owner_var = tk.StringVar(value=self.task_data['owner'])
-        owner_entry = ModernEntry(card, textvariable=self.owner_var, placeholder="Owner", width=15)
-        owner_entry.grid(row=row, column=0, sticky="ew", padx=(24, 24), pady=(2, 10))
-        card.grid_columnconfigure(0, weight=1)
-        row += 1
-        # Status
-        ttk.Label(card, text="Status", font=LABEL_FONT, foreground=LABEL_COLOR, background=CARD_BG).grid(row=row, column=0, sticky="w", padx=(24, 8), pady=(0, 0))
-        row += 1
-        self.status_var = tk.StringVar(value=self.task_data['status'])
-        status_combo = tb.Combobox(
-            card,
-            textvariable=self.status_var,
-            values=["Working on it", "Done", "Stuck", "Not Started"],
-            font=MODERN_FONT,
-            style="Modern.TCombobox"
-        )
-        status_combo.grid(row=row, column=0, sticky="ew", padx=(24, 24), pady=(2, 10))
-        card.grid_columnconfigure(0, weight=1)
-        self._add_combo_effects(status_combo)
-        row += 1
-        # Due date
-        ttk.Label(card, text="Due date", font=LABEL_FONT, foreground=LABEL_COLOR, background=CARD_BG).grid(row=row, column=0, sticky="w", padx=(24, 8), pady=(0, 0))
-        row += 1
-        self.due_var = tk.StringVar(value=self.task_data['due'])
-        due_entry = ModernEntry(card, textvariable=self.due_var, placeholder="YYYY-MM-DD", width=15)
-        due_entry.grid(row=row, column=0, sticky="ew", padx=(24, 24), pady=(2, 10))
-        card.grid_columnconfigure(0, weight=1)
-        due_entry.bind("<FocusIn>", lambda e: self._show_date_picker(due_entry))
-        due_entry.bind("<Button-1>", lambda e: self._show_date_picker(due_entry))
-        row += 1
-        # Notes
-        ttk.Label(card, text="Notes", font=LABEL_FONT, foreground=LABEL_COLOR, background=CARD_BG).grid(row=row, column=0, sticky="w", padx=(24, 8), pady=(0, 0))
-        row += 1
-        self.notes_var = tk.StringVar(value=self.task_data['notes'])
-        notes_entry = ModernEntry(card, textvariable=self.notes_var, placeholder="Notes", width=15)
-        notes_entry.grid(row=row, column=0, sticky="ew", padx=(24, 24), pady=(2, 10))
-        card.grid_columnconfigure(0, weight=1)
-        row += 1
+        # One label row and one input row per field
+        self.vars = {}
+        for i, (key, label, hint) in enumerate(FORM_FIELDS):
+            row = 2 * i
+            ttk.Label(card, text=label, font=LABEL_FONT, foreground=LABEL_COLOR, background=CARD_BG).grid(
+                row=row, column=0, sticky="w", padx=(24, 8), pady=(18 if i == 0 else 0, 0)
+            )
+            var = self.vars[key] = tk.StringVar(value=self.task_data[key])
+            if isinstance(hint, tuple):
+                widget = tb.Combobox(card, textvariable=var, values=hint, font=MODERN_FONT, style="Modern.TCombobox")
+                self._add_combo_effects(widget)
+            else:
+                widget = ModernEntry(card, textvariable=var, placeholder=hint, width=15)
+            widget.grid(row=row + 1, column=0, sticky="ew", padx=(24, 24), pady=(2, 10))
+            if key == 'due':
+                widget.bind("<FocusIn>", self._on_due_focus)
+                widget.bind("<Button-1>", self._on_due_focus)
+        row = 2 * len(FORM_FIELDS)
         btn_frame = tk.Frame(card, bg=CARD_BG)
         btn_frame.grid(row=row, column=0, sticky="ew", pady=(24, 10), padx=24)
         btn_frame.columnconfigure(0, weight=1)
         btn_frame.columnconfigure(1, weight=1)
         btn_frame.grid_propagate(True)
-        btn_frame.pack_propagate(True)
         cancel_btn = ModernButton(btn_frame, text="Cancel", primary=False, command=self.destroy, width=12)
         cancel_btn.grid(row=0, column=0, sticky="w", padx=(0, 8))
         save_btn = ModernButton(btn_frame, text="Save", primary=True, command=self._save, width=12)
         save_btn.grid(row=0, column=1, sticky="e", padx=(8, 0))
 
+    def _on_due_focus(self, event):
+        self._show_date_picker(event.widget)
+
     def _add_combo_effects(self, combo):
-        def on_focus_in(e):
-            combo.configure(style="info.TCombobox")
-        def on_focus_out(e):
-            combo.configure(style="TCombobox")
-        combo.bind("<FocusIn>", on_focus_in)
-        combo.bind("<FocusOut>", on_focus_out)
+        combo.bind("<FocusIn>", _combo_focus_in)
+        combo.bind("<FocusOut>", _combo_focus_out)
 
     def _save(self):
-        self.result = {
-            'task': self.task_var.get().strip(),
-            'owner': self.owner_var.get().strip(),
-            'status': self.status_var.get(),
-            'due': self.due_var.get().strip(),
-            'notes': self.notes_var.get().strip()
-        }
+        # One Tcl read per field; status comes from a fixed list, so it isn't stripped
+        self.result = {key: var.get() if key == 'status' else var.get().strip() for key, var in self.vars.items()}
         self.destroy()
 
 class DatePicker(tk.Toplevel):
@@ -304,8 +328,19 @@ class DatePicker(tk.Toplevel):
         self._position_picker()
         self.deiconify()
         self.focus_force()
-        self.bind("<FocusOut>", lambda e: self._close())
-        self.bind("<Escape>", lambda e: self._close())
+        self.bind("<FocusOut>", self._close)
+        self.bind("<Escape>", self._close)
+
+    def open(self, entry):
+        # Show a withdrawn picker again for entry, back on the current month
+        self.entry = entry
+        now = datetime.now()
+        self.year, self.month, self.day = now.year, now.month, now.day
+        self._month_text = None
+        self._show_month()
+        self._position_picker()
+        self.deiconify()
+        self.focus_force()
 
     def _build_ui(self):
         now = datetime.now()
@@ -318,31 +353,53 @@ class DatePicker(tk.Toplevel):
         nav.pack(fill="x")
         prev_btn = tk.Button(nav, text="<", font=self.font, bg="#f7fafd", fg="#222", bd=0, relief="flat", command=self._prev_month, width=2)
         prev_btn.pack(side="left")
-        self.month_label = tk.Label(nav, text=f"{calendar.month_name[self.month]} {self.year}", font=self.font, bg="#fff", fg="#222")
+        self._month_text = f"{_MONTH_NAMES[self.month]} {self.year}"
+        self.month_label = tk.Label(nav, text=self._month_text, font=self.font, bg="#fff", fg="#222")
         self.month_label.pack(side="left", expand=True)
         next_btn = tk.Button(nav, text=">", font=self.font, bg="#f7fafd", fg="#222", bd=0, relief="flat", command=self._next_month, width=2)
         next_btn.pack(side="right")
-        self.days_frame = tk.Frame(self.frame, bg="#fff")
-        self.days_frame.pack()
+        # One canvas for the whole month; clicks are mapped back to a day
+        self.cal_canvas = tk.Canvas(self.frame, width=7 * DAY_CELL, height=7 * DAY_CELL, bg="#fff", highlightthickness=0)
+        self.cal_canvas.pack()
+        self.cal_canvas.bind("<Button-1>", self._on_calendar_click)
+        # Weekday headers never change; only the "day" items are redrawn
+        half = DAY_CELL // 2
+        for i, d in enumerate(DAY_NAMES):
+            self.cal_canvas.create_text(i * DAY_CELL + half, half, text=d, font=self.font, fill="#888", tags="header")
+        self._rendered = None
+        self._redraw_pending = False
         self._draw_days()
 
     def _draw_days(self):
-        for widget in self.days_frame.winfo_children():
-            widget.destroy()
-        days = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
-        for i, d in enumerate(days):
-            tk.Label(self.days_frame, text=d, font=self.font, bg="#fff", fg="#888", width=3).grid(row=0, column=i)
-        cal = calendar.monthcalendar(self.year, self.month)
-        for r, week in enumerate(cal, 1):
+        # The drawing depends only on the month shown and the highlighted day
+        rendered = (self.year, self.month, self.day)
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
+        canvas = self.cal_canvas
+        canvas.delete("day")
+        half = DAY_CELL // 2
+        self._month_cal = _month_calendar(self.year, self.month)
+        for r, week in enumerate(self._month_cal, 1):
             for c, day in enumerate(week):
                 if day == 0:
-                    tk.Label(self.days_frame, text="", bg="#fff", width=3).grid(row=r, column=c)
-                else:
-                    btn = tk.Button(
-                        self.days_frame, text=str(day), font=self.font, bg="#f7fafd" if day != self.day else "#2563eb", fg="#222" if day != self.day else "#fff",
-                        bd=0, relief="flat", width=3, command=lambda d=day: self._select_date(d)
-                    )
-                    btn.grid(row=r, column=c, padx=1, pady=1)
+                    continue
+                x, y = c * DAY_CELL, r * DAY_CELL
+                selected = day == self.day
+                tags = ("day", f"d{day}")
+                canvas.create_rectangle(
+                    x + 1, y + 1, x + DAY_CELL - 1, y + DAY_CELL - 1,
+                    fill="#2563eb" if selected else "#f7fafd", outline="", tags=tags
+                )
+                canvas.create_text(x + half, y + half, text=str(day), font=self.font, fill="#fff" if selected else "#222", tags=tags)
+
+    def _on_calendar_click(self, event):
+        row = event.y // DAY_CELL - 1
+        col = event.x // DAY_CELL
+        if 0 <= row < len(self._month_cal) and 0 <= col < 7:
+            day = self._month_cal[row][col]
+            if day:
+                self._select_date(day)
 
     def _prev_month(self):
         if self.month == 1:
@@ -350,8 +407,7 @@ class DatePicker(tk.Toplevel):
             self.year -= 1
         else:
             self.month -= 1
-        self.month_label.config(text=f"{calendar.month_name[self.month]} {self.year}")
-        self._draw_days()
+        self._schedule_redraw()
 
     def _next_month(self):
         if self.month == 12:
@@ -359,7 +415,24 @@ class DatePicker(tk.Toplevel):
             self.year += 1
         else:
             self.month += 1
-        self.month_label.config(text=f"{calendar.month_name[self.month]} {self.year}")
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        # Several clicks within one event-loop pass collapse into a single redraw
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self._show_month()
+
+    def _show_month(self):
+        text = f"{_MONTH_NAMES[self.month]} {self.year}"
+        if text == self._month_text:
+            return
+        self._month_text = text
+        self.month_label.configure(text=text)
         self._draw_days()
 
     def _select_date(self, day):
@@ -371,13 +444,13 @@ class DatePicker(tk.Toplevel):
         self.master.focus_set()
 
     def _position_picker(self):
-        self.update_idletasks()
+        # The entry is already laid out, so its geometry can be read directly
         x = self.entry.winfo_rootx()
         y = self.entry.winfo_rooty() + self.entry.winfo_height()
         self.geometry(f"+{x}+{y}")
 
-    def _close(self):
-        self.destroy()
+    def _close(self, event=None):
+        self.withdraw()
 
 if __name__ == "__main__":
     app = tb.Window(themename="flatly")
@@ -8,71 +8,127 @@ from typing import Optional, Callable, Any
 from datetime import datetime
 import calendar
 from utils import center_window, create_tooltip, format_date, is_overdue
-from config import FONTS, STATUS_COLORS
-import math
+from config import FONTS, STATUS_COLORS, THEMES
+
+def invalidate_theme_cache():
+    """Forget the theme colors cached by ModernEntry; call after switching themes."""
+    ModernEntry._theme_generation += 1
 
 class ModernEntry(ttk.Entry):
     """Modern styled entry widget with placeholder support."""
     
-    def __init__(self, parent, placeholder: str = "", **kwargs):
+    # Bumped by invalidate_theme_cache; colors cached under an older value are stale
+    _theme_generation = 0
+    
+    def __init__(self, parent, placeholder: str = "", style_cache: Optional[dict] = None, **kwargs):
+        """Create the entry.
+        
+        Pass the same empty dict as ``style_cache`` when building many entries:
+        the first one fills it with the resolved theme colors and the rest
+        reuse them instead of querying the theme again.
+        """
         self.placeholder = placeholder
         
-        # Get current theme colors
-        try:
-            current_theme = "dark" if parent.winfo_toplevel().style.theme_use() == "darkly" else "light"
-            from config import THEMES
-            theme_colors = THEMES[current_theme]
-            self.placeholder_color = theme_colors["text_secondary"]
-            self.text_color = theme_colors["text_primary"]
-        except:
-            # Fallback colors
-            self.placeholder_color = "#9ca3af"
-            self.text_color = "#1f2937"
+        if style_cache:
+            colors = style_cache
+        else:
+            colors = self._cached_colors(parent)
+            if style_cache is not None:
+                style_cache.update(colors)
+        self.placeholder_color = colors["placeholder"]
+        self.text_color = colors["text"]
         
         super().__init__(parent, **kwargs)
         
         # Always set background and foreground explicitly
-        self.configure(foreground=self.placeholder_color, background=theme_colors["background_color"] if 'theme_colors' in locals() else "#fff")
+        self.configure(foreground=self.placeholder_color, background=colors["background"])
+        self._current_fg = self.placeholder_color
         
         if placeholder:
             self.insert(0, placeholder)
-            self.configure(foreground=self.placeholder_color)
+        # True while the text may be the placeholder this class inserted
+        self._showing_placeholder = True
         
         self.bind("<FocusIn>", self._on_focus_in)
         self.bind("<FocusOut>", self._on_focus_out)
         self.bind("<KeyRelease>", self._on_key_release)
     
+    @classmethod
+    def _cached_colors(cls, parent) -> dict:
+        """Theme colors for the parent's toplevel, resolved once until the theme changes."""
+        # Walk the Python master chain rather than asking Tk with winfo_toplevel
+        toplevel = parent
+        while not isinstance(toplevel, (tk.Tk, tk.Toplevel)):
+            toplevel = toplevel.master
+        # Kept on the toplevel itself so it dies with the window
+        cached = getattr(toplevel, "_entry_colors", None)
+        if cached is None or cached[0] != cls._theme_generation:
+            cached = toplevel._entry_colors = (cls._theme_generation, cls._resolve_colors(toplevel))
+        return cached[1]
+    
+    @staticmethod
+    def _resolve_colors(toplevel) -> dict:
+        """Look up placeholder, text and background colors for the toplevel's theme."""
+        # Only ttkbootstrap windows carry a style; plain Tk toplevels get the fallback
+        style = getattr(toplevel, "style", None)
+        if style is None:
+            return {"placeholder": "#9ca3af", "text": "#1f2937", "background": "#fff"}
+        current_theme = "dark" if style.theme_use() == "darkly" else "light"
+        theme_colors = THEMES[current_theme]
+        return {
+            "placeholder": theme_colors["text_secondary"],
+            "text": theme_colors["text_primary"],
+            "background": theme_colors["background_color"],
+        }
+    
+    def _set_foreground(self, color: str):
+        """Apply a foreground color, skipping the Tk call when it is already set."""
+        if color != self._current_fg:
+            self.configure(foreground=color)
+            self._current_fg = color
+    
+    def _show_placeholder(self):
+        self.delete(0, tk.END)
+        self.insert(0, self.placeholder)
+        self._set_foreground(self.placeholder_color)
+        self._showing_placeholder = True
+    
     def _on_focus_in(self, event):
-        if self.get() == self.placeholder:
-            self.delete(0, tk.END)
-            self.configure(foreground=self.text_color)
+        # Once real text is in, focusing needs no round-trip to read it
+        if self._showing_placeholder:
+            if self.get() == self.placeholder:
+                self.delete(0, tk.END)
+                self._set_foreground(self.text_color)
+            self._showing_placeholder = False
     
     def _on_focus_out(self, event):
-        if not self.get().strip():
-            self.insert(0, self.placeholder)
-            self.configure(foreground=self.placeholder_color)
+        current_text = self.get()
+        if not current_text or current_text.isspace():
+            self._show_placeholder()
     
     def _on_key_release(self, event):
         current_text = self.get()
-        if current_text and current_text != self.placeholder:
-            self.configure(foreground=self.text_color)
-        elif not current_text.strip():
-            self.configure(foreground=self.placeholder_color)
+        if not current_text or current_text.isspace():
+            self._set_foreground(self.placeholder_color)
+        elif not (self._showing_placeholder and current_text == self.placeholder):
+            self._set_foreground(self.text_color)
     
     def get_value(self) -> str:
         """Get the actual value, excluding placeholder."""
         value = self.get().strip()
-        return "" if value == self.placeholder else value
+        if self._showing_placeholder and value == self.placeholder:
+            return ""
+        return value
     
     def set_value(self, value: str):
         """Set the value, handling placeholder properly."""
-        self.delete(0, tk.END)
         if value:
+            self.delete(0, tk.END)
             self.insert(0, value)
-            self.configure(foreground=self.text_color)
+            self._set_foreground(self.text_color)
+            self._showing_placeholder = False
         else:
-            self.insert(0, self.placeholder)
-            self.configure(foreground=self.placeholder_color)
+            self._show_placeholder()
     
     def update_theme_colors(self, theme_colors: dict):
         """Update colors when theme changes."""
@@ -81,10 +137,10 @@ class ModernEntry(ttk.Entry):
         self.configure(background=theme_colors["background_color"])
         # Update current text color if it's not placeholder
         current_text = self.get()
-        if current_text and current_text != self.placeholder:
-            self.configure(foreground=self.text_color)
+        if current_text and not (self._showing_placeholder and current_text == self.placeholder):
+            self._set_foreground(self.text_color)
         else:
-            self.configure(foreground=self.placeholder_color)
+            self._set_foreground(self.placeholder_color)
 
 class ModernButton(ttk.Button):
     """Modern styled button with hover effects and loading states."""
@@ -97,17 +153,24 @@ class ModernButton(ttk.Button):
         self.original_text = text
         self.loading_text = loading_text
         self.is_loading = False
+        self._cursor = ""
         
         # Add hover effects
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
     
+    def _set_cursor(self, cursor: str):
+        """Apply a cursor, skipping the Tk call when it is already set."""
+        if cursor != self._cursor:
+            self.configure(cursor=cursor)
+            self._cursor = cursor
+    
     def _on_enter(self, event):
         if not self.is_loading:
-            self.configure(cursor="hand2")
+            self._set_cursor("hand2")
     
     def _on_leave(self, event):
-        self.configure(cursor="")
+        self._set_cursor("")
     
     def set_loading(self, loading: bool = True):
         """Set loading state for the button."""
@@ -122,38 +185,88 @@ class ModernButton(ttk.Button):
         """Enable or disable the button."""
         state = "normal" if enabled else "disabled"
         self.configure(state=state)
-        if not enabled:
-            self.configure(cursor="")
-        else:
-            self.configure(cursor="hand2")
+        self._set_cursor("hand2" if enabled else "")
 
 class SearchEntry(ModernEntry):
     """Search entry with debounced search functionality."""
     
-    def __init__(self, parent, on_search: Callable[[str], None], **kwargs):
+    # Keys that never change the text, so they shouldn't restart the debounce
+    NON_TEXT_KEYS = frozenset({
+        "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R", "Caps_Lock",
+        "Up", "Down", "Left", "Right", "Home", "End", "Tab", "Return", "KP_Enter"
+    })
+    
+    def __init__(self, parent, on_search: Callable[[str], None], scheduler: Optional[Any] = None, **kwargs):
+        """Create the search entry.
+        
+        ``scheduler`` supplies ``after``/``after_cancel`` for the debounce
+        timer; it defaults to the widget itself (Tk's event loop).
+        """
         super().__init__(parent, placeholder="Search tasks...", **kwargs)
         self.on_search = on_search
         self.search_after_id = None
+        self._scheduler = scheduler or self
+        self._last_term = None
         
-        self.bind("<KeyRelease>", self._on_search_key_release)
+        # <KeyRelease> is bound by ModernEntry to _on_key_release, overridden below
+        self.bind("<Return>", self._on_search_return)
     
-    def _on_search_key_release(self, event):
-        # Cancel previous search
+    def _cancel_pending_search(self):
         if self.search_after_id:
-            self.after_cancel(self.search_after_id)
+            self._scheduler.after_cancel(self.search_after_id)
+            self.search_after_id = None
+    
+    def _on_key_release(self, event):
+        # Keep the placeholder color in step, then debounce the search
+        super()._on_key_release(event)
+        if event.keysym in self.NON_TEXT_KEYS:
+            return
+        
+        # Cancel previous search
+        self._cancel_pending_search()
         
         # Schedule new search
-        self.search_after_id = self.after(300, self._perform_search)
+        self.search_after_id = self._scheduler.after(300, self._perform_search)
+    
+    def _on_search_return(self, event):
+        # Enter searches right away instead of waiting out the debounce
+        self._cancel_pending_search()
+        self._perform_search()
     
     def _perform_search(self):
+        self.search_after_id = None
         search_term = self.get_value()  # Use the new get_value method
+        if search_term == self._last_term:
+            return
+        self._last_term = search_term
         self.on_search(search_term)
     
+    def reset(self):
+        """Empty the field and drop any pending search without calling on_search.
+        
+        For callers that clear their own filter state, so the next typed term
+        is searched even if it matches the one before the reset.
+        """
+        self._cancel_pending_search()
+        self.set_value("")
+        self._last_term = ""
+    
     def clear_search(self):
         """Clear the search field."""
-        self.set_value("")
+        self.reset()
         self.on_search("")
 
+def _label_style(color: str, font, padding) -> dict:
+    """Configure options shared by the status pill and priority badge."""
+    return {
+        "background": color,
+        "foreground": "white",
+        "font": font,
+        "padding": padding,
+        "relief": "flat",
+        "borderwidth": 0
+    }
+
 class StatusPill(ttk.Label):
     """Status pill widget for displaying task status."""
     
@@ -162,16 +275,12 @@ class StatusPill(ttk.Label):
         self.status = status
         self._update_style()
     
+    # Full option sets per status, built once for the class
+    STYLES = {status: _label_style(color, FONTS["secondary"], (8, 4)) for status, color in STATUS_COLORS.items()}
+    DEFAULT_STYLE = _label_style("#6b7280", FONTS["secondary"], (8, 4))
+    
     def _update_style(self):
-        color = STATUS_COLORS.get(self.status, "#6b7280")
-        self.configure(
-            background=color,
-            foreground="white",
-            font=FONTS["secondary"],
-            padding=(8, 4),
-            relief="flat",
-            borderwidth=0
-        )
+        self.configure(**self.STYLES.get(self.status, self.DEFAULT_STYLE))
 
 class PriorityBadge(ttk.Label):
     """Priority badge widget."""
@@ -181,26 +290,27 @@ class PriorityBadge(ttk.Label):
         self.priority = priority
         self._update_style()
     
+    # Built once for the class instead of on every style update
+    PRIORITY_COLORS = {
+        "Low": "#10b981",
+        "Medium": "#f59e0b",
+        "High": "#ef4444",
+        "Urgent": "#dc2626"
+    }
+    
+    STYLES = {priority: _label_style(color, FONTS["caption"], (6, 2)) for priority, color in PRIORITY_COLORS.items()}
+    DEFAULT_STYLE = _label_style("#6b7280", FONTS["caption"], (6, 2))
+    
     def _update_style(self):
-        priority_colors = {
-            "Low": "#10b981",
-            "Medium": "#f59e0b", 
-            "High": "#ef4444",
-            "Urgent": "#dc2626"
-        }
-        color = priority_colors.get(self.priority, "#6b7280")
-        self.configure(
-            background=color,
-            foreground="white",
-            font=FONTS["caption"],
-            padding=(6, 2),
-            relief="flat",
-            borderwidth=0
-        )
+        self.configure(**self.STYLES.get(self.priority, self.DEFAULT_STYLE))
 
 class DatePicker(tk.Toplevel):
     """Modern date picker widget."""
     
+    # Pixel size of one calendar cell
+    CELL_WIDTH = 36
+    CELL_HEIGHT = 32
+    
     def __init__(self, parent, entry_widget, **kwargs):
         super().__init__(parent, **kwargs)
         self.entry_widget = entry_widget
@@ -238,15 +348,40 @@ class DatePicker(tk.Toplevel):
         self.calendar_frame = ttk.Frame(self)
         self.calendar_frame.pack(fill="both", expand=True, padx=8, pady=8)
         
+        # The whole month is one canvas: a header row, then a fixed 6x7 grid of
+        # cells whose text and fill are updated on every month change
+        cell_w, cell_h = self.CELL_WIDTH, self.CELL_HEIGHT
+        self.cal_canvas = tk.Canvas(
+            self.calendar_frame,
+            width=7 * cell_w,
+            height=7 * cell_h,
+            bg=ttk.Style().lookup("TFrame", "background") or "#ffffff",
+            highlightthickness=0
+        )
+        self.cal_canvas.pack()
+        
         # Day headers
         days = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
         for i, day in enumerate(days):
-            label = ttk.Label(self.calendar_frame, text=day, font=FONTS["secondary"])
-            label.grid(row=0, column=i, sticky="ew", padx=1, pady=1)
+            self.cal_canvas.create_text(
+                i * cell_w + cell_w // 2, cell_h // 2,
+                text=day, font=FONTS["secondary"], tags="header"
+            )
         
-        # Configure grid weights
-        for i in range(7):
-            self.calendar_frame.columnconfigure(i, weight=1)
+        self._cell_rects = []
+        self._cell_texts = []
+        for week_num in range(6):
+            for day_num in range(7):
+                x, y = day_num * cell_w, (week_num + 1) * cell_h
+                self._cell_rects.append(self.cal_canvas.create_rectangle(
+                    x + 1, y + 1, x + cell_w - 1, y + cell_h - 1, fill="", outline=""
+                ))
+                self._cell_texts.append(self.cal_canvas.create_text(
+                    x + cell_w // 2, y + cell_h // 2, text="", font=FONTS["primary"]
+                ))
+        self.cal_canvas.bind("<Button-1>", self._on_calendar_click)
+        now = datetime.now()
+        self._today = (now.year, now.month, now.day)
     
     def _position_window(self):
         """Position the date picker near the entry widget."""
@@ -273,45 +408,42 @@ class DatePicker(tk.Toplevel):
     
     def _load_current_month(self):
         """Load and display the current month."""
-        now = datetime.now()
-        self.current_year = now.year
-        self.current_month = now.month
+        self.current_year, self.current_month, _ = self._today
         
         self._update_calendar()
     
     def _update_calendar(self):
         """Update the calendar display."""
-        # Clear existing day buttons
-        for widget in self.calendar_frame.winfo_children():
-            if isinstance(widget, tk.Button):
-                widget.destroy()
-        
         # Update month label
-        month_name = datetime(self.current_year, self.current_month, 1).strftime("%B %Y")
-        self.month_label.configure(text=month_name)
-        
-        # Get calendar data
-        cal = calendar.monthcalendar(self.current_year, self.current_month)
-        
-        # Create day buttons
-        for week_num, week in enumerate(cal):
-            for day_num, day in enumerate(week):
-                if day != 0:
-                    btn = tk.Button(
-                        self.calendar_frame,
-                        text=str(day),
-                        font=FONTS["primary"],
-                        relief="flat",
-                        borderwidth=1,
-                        command=lambda d=day: self._select_date(d)
-                    )
-                    btn.grid(row=week_num + 1, column=day_num, sticky="ew", padx=1, pady=1)
-                    
-                    # Highlight today
-                    if (day == datetime.now().day and 
-                        self.current_month == datetime.now().month and 
-                        self.current_year == datetime.now().year):
-                        btn.configure(background="#3b82f6", foreground="white")
+        self.month_label.configure(text=f"{calendar.month_name[self.current_month]} {self.current_year}")
+        
+        # Get calendar data, padded to the grid's six weeks
+        self._month_cal = calendar.monthcalendar(self.current_year, self.current_month)
+        weeks = self._month_cal + [[0] * 7] * (6 - len(self._month_cal))
+        
+        # Relabel the cells
+        canvas = self.cal_canvas
+        days = (day for week in weeks for day in week)
+        for day, rect_id, text_id in zip(days, self._cell_rects, self._cell_texts):
+            # Highlight today
+            if (self.current_year, self.current_month, day) == self._today:
+                bg, fg = "#3b82f6", "white"
+            else:
+                bg, fg = ("#f3f4f6" if day else ""), "#1f2937"
+            canvas.itemconfigure(rect_id, fill=bg)
+            canvas.itemconfigure(text_id, text=str(day) if day else "", fill=fg)
+    
+    def _on_calendar_click(self, event):
+        """Map a click on the calendar canvas to its cell."""
+        week_num = event.y // self.CELL_HEIGHT - 1
+        day_num = event.x // self.CELL_WIDTH
+        if 0 <= week_num < 6 and 0 <= day_num < 7:
+            self._select_cell(week_num, day_num)
+    
+    def _select_cell(self, week_num, day_num):
+        """Select the date shown in a grid cell."""
+        if week_num < len(self._month_cal) and self._month_cal[week_num][day_num]:
+            self._select_date(self._month_cal[week_num][day_num])
     
     def _prev_month(self):
         """Go to previous month."""
@@ -341,6 +473,45 @@ class DatePicker(tk.Toplevel):
         finally:
             self.destroy()
 
+# Vivid, modern colors per notification type, shared by every notification
+_NOTIFICATION_COLORS = {
+    "info": {
+        "bg": "#3b82f6",
+        "fg": "#ffffff",
+        "border": "#1d4ed8",
+        "icon": "💡",
+        "shadow": "#1e40af"
+    },
+    "success": {
+        "bg": "#10b981",
+        "fg": "#ffffff",
+        "border": "#059669",
+        "icon": "✨",
+        "shadow": "#047857"
+    },
+    "warning": {
+        "bg": "#f59e0b",
+        "fg": "#ffffff",
+        "border": "#d97706",
+        "icon": "⚡",
+        "shadow": "#b45309"
+    },
+    "error": {
+        "bg": "#ef4444",
+        "fg": "#ffffff",
+        "border": "#dc2626",
+        "icon": "🔥",
+        "shadow": "#b91c1c"
+    }
+}
+
+_NOTIFICATION_TITLES = {
+    "info": "Info",
+    "success": "Success",
+    "warning": "Warning",
+    "error": "Error"
+}
+
 class ModernNotificationWidget(ttk.Frame):
     """Modern integrated notification widget for displaying messages within the app."""
     
@@ -350,40 +521,9 @@ class ModernNotificationWidget(ttk.Frame):
         self.notification_type = notification_type
         self.duration = duration
         self.is_visible = False
+        self._hide_id = None
         
-        # Configure vivid, modern colors based on type
-        self.colors = {
-            "info": {
-                "bg": "#3b82f6",
-                "fg": "#ffffff",
-                "border": "#1d4ed8",
-                "icon": "💡",
-                "shadow": "#1e40af"
-            },
-            "success": {
-                "bg": "#10b981",
-                "fg": "#ffffff",
-                "border": "#059669",
-                "icon": "✨",
-                "shadow": "#047857"
-            },
-            "warning": {
-                "bg": "#f59e0b",
-                "fg": "#ffffff",
-                "border": "#d97706",
-                "icon": "⚡",
-                "shadow": "#b45309"
-            },
-            "error": {
-                "bg": "#ef4444",
-                "fg": "#ffffff",
-                "border": "#dc2626",
-                "icon": "🔥",
-                "shadow": "#b91c1c"
-            }
-        }
-        
-        self.color_config = self.colors.get(self.notification_type, self.colors["info"])
+        self.color_config = _NOTIFICATION_COLORS.get(self.notification_type, _NOTIFICATION_COLORS["info"])
         
         self._create_widgets()
         self._show_notification()
@@ -437,12 +577,7 @@ class ModernNotificationWidget(ttk.Frame):
         message_frame.pack(side="left", fill="x", expand=True)
         
         # Compact title and message in one line
-        title_text = {
-            "info": "Info",
-            "success": "Success",
-            "warning": "Warning", 
-            "error": "Error"
-        }.get(self.notification_type, "Notification")
+        title_text = _NOTIFICATION_TITLES.get(self.notification_type, "Notification")
         
         # Combined title and message label for compact design
         self.message_label = tk.Label(
@@ -471,81 +606,47 @@ class ModernNotificationWidget(ttk.Frame):
         self.progress_frame = tk.Frame(main_container, bg=self.color_config["bg"])
         self.progress_frame.pack(fill="x", padx=12, pady=(0, 4))
         
-        # Modern progress bar
-        self.progress_bar = tk.Canvas(
+        # Modern progress bar; Tk steps it itself once started
+        bar_style = f"Notification{self.notification_type.title()}.Horizontal.TProgressbar"
+        style.configure(
+            bar_style,
+            troughcolor=self.color_config["bg"],
+            background=self.color_config["fg"],
+            bordercolor=self.color_config["bg"],
+            lightcolor=self.color_config["fg"],
+            darkcolor=self.color_config["fg"],
+            borderwidth=0,
+            thickness=3
+        )
+        self.progress_bar = ttk.Progressbar(
             self.progress_frame,
-            height=3,
-            bg=self.color_config["bg"],
-            highlightthickness=0,
-            relief="flat"
+            mode="determinate",
+            maximum=100,
+            style=bar_style
         )
         self.progress_bar.pack(fill="x")
-        
-        # Draw initial progress bar
-        self._draw_progress_bar(0)
     
     def _show_notification(self):
         """Show the notification with animation."""
         self.is_visible = True
         
-        # Simple progress animation
-        self._animate_progress()
+        # One step per 1% of the duration, so the bar fills just as it hides
+        self.progress_bar.start(max(1, self.duration // 100))
         
         # Auto-hide after duration
-        self.after(self.duration, self._hide_notification)
-    
-    def _draw_progress_bar(self, progress_percent):
-        """Draw the progress bar on canvas."""
-        try:
-            self.progress_bar.delete("all")
-            width = self.progress_bar.winfo_width()
-            if width <= 1:  # Canvas not yet sized
-                width = 300
-            
-            # Draw background
-            self.progress_bar.create_rectangle(
-                0, 0, width, 3,
-                fill=self.color_config["bg"],
-                outline=""
-            )
-            
-            # Draw progress
-            progress_width = (progress_percent / 100) * width
-            if progress_width > 0:
-                self.progress_bar.create_rectangle(
-                    0, 0, progress_width, 3,
-                    fill=self.color_config["fg"],
-                    outline=""
-                )
-        except Exception as e:
-            pass  # Ignore drawing errors
-    
-    def _animate_progress(self):
-        """Smooth progress bar animation."""
-        if not self.is_visible:
-            return
-        
-        try:
-            # Get current progress and increment
-            current_progress = getattr(self, '_current_progress', 0)
-            new_progress = min(100, current_progress + 1.5)  # Smooth increment
-            self._current_progress = new_progress
-            
-            # Draw progress bar
-            self._draw_progress_bar(new_progress)
-        except Exception as e:
-            # If there's any error, just set progress to 0
-            self._current_progress = 0
-            self._draw_progress_bar(0)
-        
-        # Continue animation
-        if self.is_visible:
-            self.after(60, self._animate_progress)  # Update every 60ms for smoother animation
+        self._hide_id = self.after(self.duration, self._hide_notification)
     
     def _hide_notification(self):
         """Hide the notification."""
         self.is_visible = False
         self.destroy()
+    
+    def destroy(self):
+        """Cancel the auto-hide timer so it can't fire on a destroyed widget."""
+        if self._hide_id is not None:
+            self.after_cancel(self._hide_id)
+            self._hide_id = None
+        super().destroy()
 
 class NotificationWidget(tk.Toplevel):
     """Legacy notification widget for backward compatibility."""
@@ -555,6 +656,7 @@ class NotificationWidget(tk.Toplevel):
         self.message = message
         self.notification_type = notification_type
         self.duration = duration
+        self._hide_id = None
         
         self.title("")
         self.geometry("300x60")
@@ -569,15 +671,8 @@ class NotificationWidget(tk.Toplevel):
         self._start_timer()
     
     def _create_widgets(self):
-        # Configure colors based on type
-        colors = {
-            "info": {"bg": "#3b82f6", "fg": "white"},
-            "success": {"bg": "#10b981", "fg": "white"},
-            "warning": {"bg": "#f59e0b", "fg": "white"},
-            "error": {"bg": "#ef4444", "fg": "white"}
-        }
-        
-        color_config = colors.get(self.notification_type, colors["info"])
+        # Colors based on type
+        color_config = _NOTIFICATION_COLORS.get(self.notification_type, _NOTIFICATION_COLORS["info"])
         
         # Main frame
         main_frame = tk.Frame(self, bg=color_config["bg"], relief="flat", borderwidth=1)
@@ -607,8 +702,7 @@ class NotificationWidget(tk.Toplevel):
     
     def _position_window(self):
         """Position the notification in the top-right corner."""
-        self.update_idletasks()
-        
+        # Only the screen size is needed, so there is no layout to flush first
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
         
@@ -619,11 +713,24 @@ class NotificationWidget(tk.Toplevel):
     
     def _start_timer(self):
         """Start the auto-close timer."""
-        self.after(self.duration, self.destroy)
+        self._hide_id = self.after(self.duration, self.destroy)
+    
+    def destroy(self):
+        """Cancel the auto-close timer when closed early."""
+        if self._hide_id is not None:
+            self.after_cancel(self._hide_id)
+            self._hide_id = None
+        super().destroy()
 
 class LoadingSpinner(tk.Canvas):
     """Loading spinner widget."""
     
+    # Segment colors fade from the accent blue; opacity drops 10% per segment
+    SEGMENT_FILLS = tuple(
+        f"#{int(59 * o):02x}{int(130 * o):02x}{int(246 * o):02x}"
+        for o in (max(0.1, 1.0 - i * 0.1) for i in range(8))
+    )
+    
     def __init__(self, parent, size: int = 40, **kwargs):
         super().__init__(parent, width=size, height=size, **kwargs)
         self.size = size
@@ -631,45 +738,23 @@ class LoadingSpinner(tk.Canvas):
         self.is_spinning = False
         
         self.configure(bg="white", highlightthickness=0)
-        self._draw_spinner()
-    
-    def _draw_spinner(self):
-        """Draw the spinner."""
-        center = self.size // 2
-        radius = (self.size // 2) - 4
-        
-        # Clear canvas
-        self.delete("all")
-        
-        # Draw spinner segments
-        for i in range(8):
-            angle = self.angle + (i * 45)
-            start_angle = angle
-            end_angle = angle + 30
-            
-            # Calculate opacity based on position
-            opacity = 1.0 - (i * 0.1)
-            if opacity < 0.1:
-                opacity = 0.1
-            
-            # Convert angle to radians
-            start_rad = math.radians(start_angle)
-            end_rad = math.radians(end_angle)
-            
-            # Calculate coordinates
-            x1 = center + radius * math.cos(start_rad)
-            y1 = center + radius * math.sin(start_rad)
-            x2 = center + radius * math.cos(end_rad)
-            y2 = center + radius * math.sin(end_rad)
-            
-            # Draw arc
+        
+        # Create the segments once; animation only rotates them
+        center = size // 2
+        radius = (size // 2) - 4
+        self._arc_ids = [
             self.create_arc(
                 center - radius, center - radius,
                 center + radius, center + radius,
-                start=start_angle, extent=30,
-                fill=f"#{int(59 * opacity):02x}{int(130 * opacity):02x}{int(246 * opacity):02x}",
-                outline=""
+                start=i * 45, extent=30, fill=fill, outline=""
             )
+            for i, fill in enumerate(self.SEGMENT_FILLS)
+        ]
+    
+    def _draw_spinner(self):
+        """Rotate the spinner segments to the current angle."""
+        for i, arc_id in enumerate(self._arc_ids):
+            self.itemconfigure(arc_id, start=self.angle + i * 45)
     
     def start(self):
         """Start the spinner animation."""
@@ -685,7 +770,7 @@ class LoadingSpinner(tk.Canvas):
         if self.is_spinning:
             self.angle = (self.angle + 10) % 360
             self._draw_spinner()
-            self.after(50, self._animate)
+            self.after(33, self._animate)  # ~30 fps
 
 class ModernCloseButton(tk.Canvas):
     """Modern minimalist close button with hover effects."""
@@ -703,7 +788,7 @@ class ModernCloseButton(tk.Canvas):
         self.is_hovered = False
         
         # Configure canvas
-        self.configure(
+        super().configure(
             bg=bg,
             highlightthickness=0,
             relief="flat",
@@ -716,72 +801,61 @@ class ModernCloseButton(tk.Canvas):
         self.bind("<Button-1>", self._on_click)
         self.bind("<ButtonRelease-1>", self._on_release)
         
-        # Draw initial state
-        self._draw_button()
-    
-    def _draw_button(self):
-        """Draw the close button."""
-        self.delete("all")
-        
-        # Determine colors based on hover state
-        bg_color = self.hover_bg if self.is_hovered else self.bg
-        fg_color = self.hover_fg if self.is_hovered else self.fg
-        
-        # Handle transparent background
-        if bg_color == "transparent":
-            # Get parent background color
-            try:
-                parent_bg = self.master.cget("bg")
-                bg_color = parent_bg if parent_bg else "#ffffff"
-            except:
-                bg_color = "#ffffff"
-        
-        # Draw background circle
+        # Create the circle and X once; hover only recolors them
         padding = 2
-        self.create_oval(
+        self._bg_id = self.create_oval(
             padding, padding,
             self.size - padding, self.size - padding,
-            fill=bg_color,
             outline="",
             tags="background"
         )
-        
-        # Draw X icon
         icon_padding = 6
         # First diagonal line
-        self.create_line(
+        self._line1 = self.create_line(
             icon_padding, icon_padding,
             self.size - icon_padding, self.size - icon_padding,
-            fill=fg_color,
             width=2,
             capstyle="round",
             tags="icon"
         )
         # Second diagonal line
-        self.create_line(
+        self._line2 = self.create_line(
             self.size - icon_padding, icon_padding,
             icon_padding, self.size - icon_padding,
-            fill=fg_color,
             width=2,
             capstyle="round",
             tags="icon"
         )
+        self._draw_button()
+    
+    def _draw_button(self):
+        """Color the close button for the current hover state."""
+        # Determine colors based on hover state
+        bg_color = self.hover_bg if self.is_hovered else self.bg
+        fg_color = self.hover_fg if self.is_hovered else self.fg
+        
+        # Handle transparent background
+        if bg_color == "transparent":
+            # Get parent background color
+            try:
+                parent_bg = self.master.cget("bg")
+                bg_color = parent_bg if parent_bg else "#ffffff"
+            except:
+                bg_color = "#ffffff"
+        
+        self.itemconfigure(self._bg_id, fill=bg_color)
+        self.itemconfigure(self._line1, fill=fg_color)
+        self.itemconfigure(self._line2, fill=fg_color)
     
     def _on_enter(self, event):
         """Handle mouse enter event."""
         self.is_hovered = True
         self._draw_button()
-        
-        # Add subtle scale animation
-        self.scale("all", self.size/2, self.size/2, 1.1, 1.1)
     
     def _on_leave(self, event):
         """Handle mouse leave event."""
         self.is_hovered = False
         self._draw_button()
-        
-        # Reset scale
-        self.scale("all", self.size/2, self.size/2, 1.0, 1.0)
     
     def _on_click(self, event):
         """Handle click event."""
@@ -790,8 +864,8 @@ class ModernCloseButton(tk.Canvas):
     
     def _on_release(self, event):
         """Handle button release event."""
-        # Reset scale
-        self.scale("all", self.size/2, self.size/2, 1.0, 1.0)
+        # Undo the click scale
+        self.scale("all", self.size/2, self.size/2, 1/0.95, 1/0.95)
         
         # Execute command
         if self.command:
@@ -810,8 +884,11 @@ class ModernCloseButton(tk.Canvas):
         if "command" in kwargs:
             self.command = kwargs["command"]
         
-        # Redraw with new colors
+        # Recolor with new colors
         self._draw_button()
         
-        # Call parent configure
-        super().configure(**kwargs) 
\ No newline at end of file
+        # Pass the remaining options on to the canvas
+        for key in ("fg", "hover_bg", "hover_fg", "command"):
+            kwargs.pop(key, None)
+        if kwargs:
+            super().configure(**kwargs)
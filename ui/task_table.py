@@ -368,9 +368,8 @@ class ModernTaskTable(ttk.Frame):
     
     def _refresh_display(self):
         """Refresh the table display."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items in a single Tcl call
+        self.tree.delete(*self.tree.get_children())
         
         # Add filtered tasks
         for i, task in enumerate(self.filtered_tasks):
@@ -408,12 +407,7 @@ class ModernTaskTable(ttk.Frame):
             
             actions = "✏️ 🗑️"
             
-            # Insert into treeview
-            item = self.tree.insert("", "end", values=(
-                checkbox, title, owner, status, priority, due_date, estimated, actions
-            ))
-            
-            # Apply tags for styling
+            # Tags for styling
             tags = []
             if task.get('completed'):
                 tags.append("completed")
@@ -428,15 +422,17 @@ class ModernTaskTable(ttk.Frame):
             tags.append(f"status_{status.lower().replace(' ', '_')}")
             tags.append(f"priority_{priority.lower()}")
             
-            self.tree.item(item, tags=tags)
+            # Insert with values and tags together so each row is one Tcl call
+            self.tree.insert("", "end", values=(
+                checkbox, title, owner, status, priority, due_date, estimated, actions
+            ), tags=tags)
             
         except Exception as e:
             print(f"Error inserting task {task.get('id', 'unknown')}: {e}")
             # Insert a placeholder row to maintain table structure
-            item = self.tree.insert("", "end", values=(
+            self.tree.insert("", "end", values=(
                 "☐", "Error loading task", "—", "Not Started", "Medium", "—", "—", "✏️ 🗑️"
-            ))
-            self.tree.item(item, tags=["error"])
+            ), tags=["error"])
     
     def _format_due_date(self, due_date: Optional[str]) -> str:
         """Format due date for display."""
@@ -500,7 +496,7 @@ class ModernTaskTable(ttk.Frame):
     
     def _clear_filters(self):
         """Clear all filters."""
-        self.search_entry.delete(0, tk.END)
+        self.search_entry.reset()
         self.status_var.set("All")
         self.priority_var.set("All")
         self.search_term = ""
@@ -6,6 +6,7 @@ from tkinter import ttk
 import ttkbootstrap as tb
 from typing import Dict, Any, Callable
 from config import THEMES, FONTS
+from ui.components import invalidate_theme_cache
 
 class ThemeManager:
     """Manages application themes and provides dynamic theme switching."""
@@ -130,6 +131,9 @@ class ThemeManager:
         # Update window background
         self.root.configure(bg=theme_config["background_color"])
         
+        # Entries created from now on must pick up the new colors
+        invalidate_theme_cache()
+        
         # Notify all registered callbacks
         for callback in self.theme_callbacks:
             try:
@@ -5,7 +5,9 @@ import re
 import time
 import threading
 from typing import Optional, Callable, Any
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator
 from tkinter import messagebox
 import tkinter as tk
 
@@ -28,21 +30,41 @@ def validate_email(email: str) -> bool:
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     return re.match(pattern, email) is not None
 
+@lru_cache(maxsize=8192)
+def _parse_date(date_string: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, caching results since the same dates repeat across rows."""
+    try:
+        return datetime.strptime(date_string, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+# [today's date, time it was computed]; refreshed at most once a second
+_today_cache = [None, 0.0]
+
+def _today() -> date:
+    """Return today's date, reusing the last value for up to a second."""
+    now = time.time()
+    if now - _today_cache[1] > 1:
+        _today_cache[:] = [date.today(), now]
+    return _today_cache[0]
+
 def format_date(date_string: str, format_type: str = "short") -> str:
     """Format date string for display."""
     if not date_string:
         return ""
     
     try:
-        date_obj = datetime.strptime(date_string, "%Y-%m-%d")
+        date_obj = _parse_date(date_string)
+        if date_obj is None:
+            raise ValueError(date_string)
         
         if format_type == "short":
             return date_obj.strftime("%b %d")
         elif format_type == "long":
             return date_obj.strftime("%B %d, %Y")
         elif format_type == "relative":
-            today = datetime.now().date()
-            date_only = date_obj.date()
+            today = _today()
+            date_only = date_obj
             
             if date_only == today:
                 return "Today"
@@ -67,10 +89,20 @@ def is_overdue(date_string) -> bool:
         return False
     
     try:
-        due_date = datetime.strptime(date_string, "%Y-%m-%d").date()
-        return due_date < datetime.now().date()
-    except ValueError:
+        due_date = _parse_date(date_string)
+    except TypeError:
+        # Unhashable or non-string input
         return False
+    return due_date is not None and due_date < _today()
+
+def is_overdue_batch(date_strings) -> list:
+    """Check many dates at once; returns a list of booleans matching is_overdue."""
+    today = _today()
+    results = []
+    for date_string in date_strings:
+        due_date = _parse_date(date_string) if isinstance(date_string, str) and date_string else None
+        results.append(due_date is not None and due_date < today)
+    return results
 
 def truncate_text(text: str, max_length: int = 50) -> str:
     """Truncate text to specified length with ellipsis."""
@@ -246,50 +278,52 @@ def get_priority_color(priority: str) -> str:
     }
     return priority_colors.get(priority, "#6b7280")
 
-def validate_task_data(data: dict) -> tuple[bool, str]:
-    """Validate task data and return (is_valid, error_message)."""
-    errors = []
+class _TaskInput(BaseModel):
+    """Field rules for task form data, checked by pydantic's compiled validator."""
     
-    # Title validation
-    title = data.get('title', '').strip()
-    if not title:
-        errors.append("Task title is required")
-    elif len(title) > 100:
-        errors.append("Task title must be 100 characters or less")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
     
-    # Due date validation
-    due_date = data.get('due_date', '').strip()
-    if due_date and not validate_date(due_date):
-        errors.append("Invalid due date format. Use YYYY-MM-DD (e.g., 2024-12-31)")
+    title: str = Field(min_length=1, max_length=100)
+    due_date: Optional[str] = None
+    owner: Optional[str] = Field(default=None, max_length=50)
+    estimated_hours: Optional[float] = Field(default=None, ge=0, le=1000)
+    notes: Optional[str] = Field(default=None, max_length=1000)
+    tags: Optional[str] = Field(default=None, max_length=200)
     
-    # Owner validation
-    owner = data.get('owner', '').strip()
-    if owner and len(owner) > 50:
-        errors.append("Owner name must be 50 characters or less")
-    
-    # Estimated hours validation
-    estimated_hours = data.get('estimated_hours')
-    if estimated_hours is not None:
-        try:
-            hours = float(estimated_hours)
-            if hours < 0:
-                errors.append("Estimated hours must be a positive number")
-            elif hours > 1000:
-                errors.append("Estimated hours must be 1000 or less")
-        except (ValueError, TypeError):
-            errors.append("Estimated hours must be a valid number")
-    
-    # Notes validation
-    notes = data.get('notes', '').strip()
-    if notes and len(notes) > 1000:
-        errors.append("Notes must be 1000 characters or less")
-    
-    # Tags validation
-    tags = data.get('tags', '').strip()
-    if tags and len(tags) > 200:
-        errors.append("Tags must be 200 characters or less")
-    
-    if errors:
+    @field_validator("due_date")
+    @classmethod
+    def _check_due_date(cls, v):
+        if v and not validate_date(v):
+            raise ValueError("invalid date")
+        return v
+
+_TASK_INPUT_ADAPTER = TypeAdapter(_TaskInput)
+
+# (field, pydantic error type) -> message; field-only keys are the fallback
+_TASK_ERROR_MESSAGES = {
+    ("title", "string_too_long"): "Task title must be 100 characters or less",
+    "title": "Task title is required",
+    "due_date": "Invalid due date format. Use YYYY-MM-DD (e.g., 2024-12-31)",
+    "owner": "Owner name must be 50 characters or less",
+    ("estimated_hours", "greater_than_equal"): "Estimated hours must be a positive number",
+    ("estimated_hours", "less_than_equal"): "Estimated hours must be 1000 or less",
+    "estimated_hours": "Estimated hours must be a valid number",
+    "notes": "Notes must be 1000 characters or less",
+    "tags": "Tags must be 200 characters or less",
+}
+
+def validate_task_data(data: dict) -> tuple[bool, str]:
+    """Validate task data and return (is_valid, error_message)."""
+    try:
+        _TASK_INPUT_ADAPTER.validate_python(data)
+    except ValidationError as e:
+        errors = []
+        for error in e.errors():
+            field = error["loc"][0] if error["loc"] else ""
+            errors.append(_TASK_ERROR_MESSAGES.get(
+                (field, error["type"]),
+                _TASK_ERROR_MESSAGES.get(field, error["msg"])
+            ))
         return False, "\n".join(f"• {error}" for error in errors)
     
-    return True, "" 
\ No newline at end of file
+    return True, ""